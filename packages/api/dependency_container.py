@@ -23,6 +23,8 @@ from .models.transcription.transcriber_interface import TranscriberInterface
 RECORDINGS_DIR = os.path.join(os.path.dirname(__file__), "recordings")
 SAMPLE_RATE = 16000
 RETRIEVAL_LIMIT = 2
+ANSWER_CACHE_SIZE = 128
+ANSWER_CACHE_TTL = 60.0
 
 
 @dataclass
@@ -80,7 +82,11 @@ class Container:
 
         # LLM + RAG
         llm_model = Qwen3LlamaCppModel()
-        rag_service = LLMRAGService(llm_model=llm_model)
+        rag_service = LLMRAGService(
+            llm_model=llm_model,
+            answer_cache_size=ANSWER_CACHE_SIZE,
+            answer_cache_ttl=ANSWER_CACHE_TTL,
+        )
 
         # Threshold filter service
         threshold_filter_service = ThresholdFilterService(relevance_threshold=0.0)
@@ -1,3 +1,4 @@
+import heapq
 from dataclasses import dataclass, field
 
 from .memory_request import MemoryRequest
@@ -81,10 +82,8 @@ class MemoryContext:
 
     def get_top_memories(self, limit: int) -> list[tuple]:
         """Get the top N memories by score."""
-        # Sort memory IDs by their scores
-        sorted_ids = sorted(
-            self.scores.keys(), key=lambda id: self.scores[id], reverse=True
-        )[:limit]
+        # Select the top memory IDs by score without sorting all of them
+        sorted_ids = heapq.nlargest(limit, self.scores, key=self.scores.__getitem__)
         # Return tuples of (memory, score) for the top IDs
         return [
             (
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import cached_property
 from datetime import datetime
 from enum import Enum
 from uuid import UUID, uuid4
@@ -72,8 +73,24 @@ class MemoryRequest:
             memory_type=memory_type,
         )
 
+    @cached_property
+    def full_text(self) -> str:
+        """
+        All text segments joined with spaces.
+
+        Computed on first access and cached, so the text segments should not
+        be modified afterwards.
+
+        Returns:
+            str: The joined text
+        """
+        return " ".join(self.text)
+
     def to_chunk(
-        self, session_id: str, chunk_type: stt_pb2.ChunkType | None = None
+        self,
+        session_id: str,
+        chunk_type: stt_pb2.ChunkType | None = None,
+        metadata_template: stt_pb2.ChunkMetadata | None = None,
     ) -> stt_pb2.MemoryChunk:
         """
         Convert this memory request to a protobuf MemoryChunk message.
@@ -83,10 +100,20 @@ class MemoryRequest:
             chunk_type (stt_pb2.ChunkType | None): Override the default
                 chunk type mapping. If None, it will be derived from
                 memory_type.
+            metadata_template (stt_pb2.ChunkMetadata | None): Prebuilt
+                metadata copied into the chunk instead of building it from
+                session_id and chunk_type. Useful when converting many
+                memories for the same session.
 
         Returns:
             stt_pb2.MemoryChunk: Protobuf message containing the memory data
         """
+        if metadata_template is not None:
+            chunk = stt_pb2.MemoryChunk()
+            chunk.metadata.CopyFrom(metadata_template)
+            chunk.metadata.memory_id = str(self.id) if self.id else ""
+            return self._fill_chunk_data(chunk)
+
         # Map memory type to chunk type if not explicitly provided
         if chunk_type is None:
             chunk_type_map = {
@@ -103,13 +130,14 @@ class MemoryRequest:
             type=chunk_type,
         )
 
-        # Create the chunk with either text or audio
-        chunk = stt_pb2.MemoryChunk(metadata=metadata)
+        return self._fill_chunk_data(stt_pb2.MemoryChunk(metadata=metadata))
 
+    def _fill_chunk_data(self, chunk: stt_pb2.MemoryChunk) -> stt_pb2.MemoryChunk:
+        # Fill the chunk with either text or audio
         if self.audio_data:
             chunk.audio_data = self.audio_data
         elif self.text:
             # Join all text segments
-            chunk.text_data = " ".join(self.text)
+            chunk.text_data = self.full_text
 
         return chunk
@@ -2,7 +2,9 @@
 # It has been adapted for this projects interfaces.
 from __future__ import annotations
 
+import functools
 import logging
+from collections.abc import Callable
 from typing import Any
 
 import numpy as np
@@ -53,6 +55,8 @@ class SimulStreamingWhisperTranscriber(TranscriberInterface):
         segment_length: float = 0.5,
         # language handling
         default_language: str = "auto",
+        # inference precision on CUDA: "fp32" | "fp16" | "bf16"
+        precision: str = "fp16",
     ):
         self.model_path = model_path
         self.beams = beams
@@ -69,8 +73,15 @@ class SimulStreamingWhisperTranscriber(TranscriberInterface):
         self.logdir = logdir
         self.segment_length = float(segment_length)
         self.default_language = default_language
+        self.precision = self._resolve_precision(precision)
 
         self.model: PaddedAlignAttWhisper | None = None
+        # Set once the model has been fed since its last refresh_segment
+        self._needs_refresh = False
+        # token id -> raw utf-8 bytes, filled lazily by _token_bytes
+        self._tok_bytes: dict[int, bytes] = {}
+        # token-id tuple -> decoded text, bound in initialize()
+        self._decode_cached: Callable[[tuple[int, ...]], str] | None = None
 
         # Internal buffer for accumulating small chunks
         self._audio_buffer: list[np.ndarray] = []
@@ -111,14 +122,18 @@ class SimulStreamingWhisperTranscriber(TranscriberInterface):
             logdir=self.logdir,
         )
         self.model = PaddedAlignAttWhisper(cfg)
+        self._apply_precision()
+        self._decode_cached = functools.lru_cache(maxsize=4096)(self._decode_tokens)
         self._reset_online_state()
         # Hard reset model buffers for a clean start
         self.model.refresh_segment(complete=True)
+        self._needs_refresh = False
 
         logger.info(
             "SimulStreamingWhisperTranscriber initialized: "
             f"model={self.model_path}, beams={self.beams}, "
-            f"decoder={self.decoder_type}, task={self.task}"
+            f"decoder={self.decoder_type}, task={self.task}, "
+            f"dtype={self.model.model.dtype}"
         )
 
     def transcribe(
@@ -140,20 +155,20 @@ class SimulStreamingWhisperTranscriber(TranscriberInterface):
             audio has been accumulated yet.
         """
         self._ensure_initialized()
+        model = self.model
+        self._needs_refresh = True
 
         # Optional language override (only on first call with language set)
-        if language and not hasattr(self.model, "detected_language"):
-            self.model.create_tokenizer(language)
-            self.model.detected_language = language
+        if language and not hasattr(model, "detected_language"):
+            model.create_tokenizer(language)
+            model.detected_language = language
 
         # Normalize input
         if audio is None or audio.size == 0:
             return [], {}
 
-        if audio.ndim != 1:
-            audio = audio.reshape(-1)
-        if audio.dtype != np.float32:
-            audio = audio.astype(np.float32)
+        # Flatten + cast in one step; a no-op for contiguous 1-D float32 input
+        audio = np.ascontiguousarray(audio.reshape(-1), dtype=np.float32)
 
         # Add to internal buffer
         self._audio_buffer.append(audio)
@@ -163,8 +178,12 @@ class SimulStreamingWhisperTranscriber(TranscriberInterface):
         if self._buffer_duration < self._min_chunk_duration:
             return [], {}
 
-        # Concatenate buffered audio
-        buffered_audio = np.concatenate(self._audio_buffer)
+        # Concatenate buffered audio (zero-copy when a single chunk was buffered;
+        # torch.from_numpy below shares that memory as well)
+        if len(self._audio_buffer) == 1:
+            buffered_audio = self._audio_buffer[0]
+        else:
+            buffered_audio = np.concatenate(self._audio_buffer)
         self._audio_buffer = []
         self._buffer_duration = 0.0
 
@@ -174,19 +193,23 @@ class SimulStreamingWhisperTranscriber(TranscriberInterface):
         self._end_sec += len(buffered_audio) / self.SAMPLING_RATE
 
         # Insert audio and maybe evict old audio from model's ring buffer
-        removed_sec = self.model.insert_audio(torch.from_numpy(buffered_audio))
+        removed_sec = model.insert_audio(torch.from_numpy(buffered_audio))
         self._audio_buffer_offset_sec += removed_sec
 
         # Decode incrementally (not final)
-        tokens, generation = self.model.infer(is_last=False)
+        tokens, generation = model.infer(is_last=False)
 
         # Hide incomplete unicode to avoid '�' glitches
         tokens = self._hide_incomplete_unicode(tokens)
 
+        # Nothing new to emit: skip timestamping and decoding entirely
+        if not tokens:
+            return segments, self._info(language)
+
         # Turn tokens into (start, end, word) using attention frames
         ts_words = self._timestamped_text(tokens, generation)
 
-        text = self.model.tokenizer.decode(tokens) if tokens else ""
+        text = self._decode_cached(tuple(tokens))
 
         if text:
             # Map local frame times to absolute audio times
@@ -216,31 +239,27 @@ class SimulStreamingWhisperTranscriber(TranscriberInterface):
                 )
             )
 
-        info = {
-            "language": getattr(
-                self.model, "detected_language", language or self.default_language
-            ),
-            "beams": self.beams,
-            "decoder_type": self.decoder_type,
-            "task": self.task,
-            "frame_threshold": self.frame_threshold,
-            "audio_max_len": self.audio_max_len,
-            "audio_min_len": self.audio_min_len,
-            "model_path": self.model_path,
-        }
-        return segments, info
+        return segments, self._info(language)
 
     def reset_state(self):
         """Reset internal state for a new transcription session."""
         self._reset_online_state()
         self._audio_buffer = []
         self._buffer_duration = 0.0
-        if self.model is not None:
+        # Skip the model refresh if nothing was transcribed since the last one
+        # (e.g. the session reset right after initialize())
+        if self.model is not None and self._needs_refresh:
             self.model.refresh_segment(complete=True)
+            self._needs_refresh = False
 
     def cleanup(self):
         """Release model to allow GC."""
         self.model = None
+        self._needs_refresh = False
+        self._tok_bytes = {}
+        if self._decode_cached is not None:
+            self._decode_cached.cache_clear()
+            self._decode_cached = None
 
     # ------------------------------- Internals ---------------------------------
 
@@ -256,6 +275,46 @@ class SimulStreamingWhisperTranscriber(TranscriberInterface):
             raise ValueError("decoder_type must be 'greedy' or 'beam'.")
         return decoder
 
+    def _resolve_precision(self, precision: str) -> str:
+        if precision not in ("fp32", "fp16", "bf16"):
+            raise ValueError("precision must be 'fp32', 'fp16' or 'bf16'.")
+        return precision
+
+    def _apply_precision(self):
+        """
+        Cast the Whisper weights (and the CIF head) to half precision.
+
+        Only applied on CUDA; CPU inference stays in FP32. Attention softmax
+        is still accumulated in FP32 inside the model, and the mel
+        spectrogram is cast to the model dtype right before the encoder.
+        """
+        if self.precision == "fp32" or self.model.model.device.type != "cuda":
+            return
+
+        dtype = torch.float16
+        if self.precision == "bf16":
+            if torch.cuda.is_bf16_supported():
+                dtype = torch.bfloat16
+            else:
+                logger.warning("bf16 not supported on this GPU, falling back to fp16")
+
+        self.model.model.to(dtype)
+        self.model.CIFLinear.to(dtype)
+
+    def _info(self, language: str | None) -> dict[str, Any]:
+        return {
+            "language": getattr(
+                self.model, "detected_language", language or self.default_language
+            ),
+            "beams": self.beams,
+            "decoder_type": self.decoder_type,
+            "task": self.task,
+            "frame_threshold": self.frame_threshold,
+            "audio_max_len": self.audio_max_len,
+            "audio_min_len": self.audio_min_len,
+            "model_path": self.model_path,
+        }
+
     def _ensure_initialized(self):
         if self.model is None:
             self.initialize()
@@ -284,7 +343,6 @@ class SimulStreamingWhisperTranscriber(TranscriberInterface):
         if not generation:
             return []
 
-        pr = generation["progress"]
         # Prefer precomputed word splits if available; otherwise recompute now.
         if "result" not in generation or self._unicode_buffer:
             split_words, split_tokens = self.model.tokenizer.split_to_word_tokens(
@@ -294,34 +352,38 @@ class SimulStreamingWhisperTranscriber(TranscriberInterface):
             split_words = generation["result"]["split_words"]
             split_tokens = generation["result"]["split_tokens"]
 
-        # One attention frame per decode step; take most-attended frame of last row
-        frames = [p["most_attended_frames"][0] for p in pr]
+        # One attention frame per decode step; take most-attended frame of last row.
+        # The wrapper collects the top-beam frames in a flat list as it decodes.
+        frames = generation.get("most_attended_frames")
+        if frames is None:
+            frames = [p["most_attended_frames"][0] for p in generation["progress"]]
 
         # If we hid an incomplete unicode, pad frames so alignment stays
         # consistent (adapted) :contentReference[oaicite:6]{index=6}
         if frames and self._unicode_buffer:
             frames = [frames[0]] * len(self._unicode_buffer) + frames
 
-        toks = tokens.copy()
+        # Walk tokens and frames in lockstep with a shared cursor
+        ti = 0
+        debug = logger.isEnabledFor(logging.DEBUG)
         out: list[tuple[float, float, str]] = []
         for word, token_ids in zip(split_words, split_tokens, strict=True):
-            begin_frame = None
+            begin_frame = frames[ti]
             for t_id in token_ids:
-                t, f = toks.pop(0), frames.pop(0)
-                if t != t_id:
+                if tokens[ti] != t_id:
                     raise ValueError(
                         "Token mismatch during timestamping: "
-                        f"{t} != {t_id} at frame {f}."
+                        f"{tokens[ti]} != {t_id} at frame {frames[ti]}."
                     )
-                if begin_frame is None:
-                    begin_frame = f
-            end_frame = f  # last one from the loop above
+                ti += 1
+            end_frame = frames[ti - 1]
             out.append((
                 begin_frame * self.ATTEN_FRAME_SEC,
                 end_frame * self.ATTEN_FRAME_SEC,
                 word,
             ))
-            logger.debug("TS-WORD:\t%s", " ".join(map(str, out[-1])))
+            if debug:
+                logger.debug("TS-WORD:\t%s", " ".join(map(str, out[-1])))
         return out
 
     def _hide_incomplete_unicode(self, tokens: list[int]) -> list[int]:
@@ -334,9 +396,47 @@ class SimulStreamingWhisperTranscriber(TranscriberInterface):
             tokens = self._unicode_buffer + tokens
             self._unicode_buffer = []
 
-        chars, _ = self.model.tokenizer.split_tokens_on_unicode(tokens)
-        if chars and chars[-1].endswith("�"):
+        if tokens and self._ends_with_incomplete_utf8(tokens):
             # Keep last token for the next iteration
             self._unicode_buffer = tokens[-1:]
             return tokens[:-1]
         return tokens
+
+    def _decode_tokens(self, tokens: tuple[int, ...]) -> str:
+        return self.model.tokenizer.decode(list(tokens))
+
+    def _token_bytes(self, token: int) -> bytes:
+        data = self._tok_bytes.get(token)
+        if data is None:
+            encoding = self.model.tokenizer.encoding
+            data = self._tok_bytes[token] = encoding.decode_single_token_bytes(token)
+        return data
+
+    def _ends_with_incomplete_utf8(self, tokens: list[int]) -> bool:
+        """
+        Check whether the byte stream of `tokens` ends mid UTF-8 sequence.
+
+        Only the trailing bytes are inspected: a UTF-8 sequence is at most
+        4 bytes long, so at most the last 4 tokens need to be looked up.
+        """
+        tail = b""
+        for token in reversed(tokens[-4:]):
+            tail = self._token_bytes(token) + tail
+            if len(tail) >= 4:
+                break
+
+        # Walk back over continuation bytes (10xxxxxx) to the lead byte
+        for i in range(1, min(4, len(tail)) + 1):
+            byte = tail[-i]
+            if byte & 0xC0 == 0x80:
+                continue
+            if byte >= 0xF0:
+                needed = 4
+            elif byte >= 0xE0:
+                needed = 3
+            elif byte >= 0xC0:
+                needed = 2
+            else:
+                needed = 1
+            return needed > i
+        return False
@@ -359,8 +359,8 @@ class PaddedAlignAttWhisper:
         # the len of actual audio
         content_mel_len = int((mel_padded.shape[2] - mel.shape[2])/2)
 
-        # encode
-        encoder_feature = self.model.encoder(mel)
+        # encode (mel is computed in fp32, the model may run in fp16/bf16)
+        encoder_feature = self.model.encoder(mel.to(self.model.dtype))
 
 #        logger.debug(f"Encoder feature shape: {encoder_feature.shape}")
 #        if mel.shape[-2:] != (self.model.dims.n_audio_ctx, self.model.dims.n_audio_state):
@@ -395,6 +395,8 @@ class PaddedAlignAttWhisper:
         token_len_before_decoding = current_tokens.shape[1]
         
         generation_progress = []
+        # top-beam most attended frame per decoding step, mirrors generation_progress
+        most_attended_frames_top = []
         generation = {
             "starting_tokens": BeamTokens(current_tokens[0,:].clone(), self.cfg.beam_size),
             "token_len_before_decoding": token_len_before_decoding,
@@ -411,6 +413,7 @@ class PaddedAlignAttWhisper:
 
             # to be filled in the loop
             "progress": generation_progress,
+            "most_attended_frames": most_attended_frames_top,
         }
         while not completed and current_tokens.shape[1] < self.max_text_len: # bos is 3 tokens
             generation_progress_loop = []
@@ -502,6 +505,7 @@ class PaddedAlignAttWhisper:
 
 
             generation_progress.append(dict(generation_progress_loop))
+            most_attended_frames_top.append(most_attended_frame)
             logger.debug("current tokens" + str(current_tokens.shape))
             if completed:
             #    # stripping the last token, the eot
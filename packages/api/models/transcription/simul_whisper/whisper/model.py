@@ -335,6 +335,10 @@ class Whisper(nn.Module):
     def device(self):
         return next(self.parameters()).device
 
+    @property
+    def dtype(self):
+        return next(self.parameters()).dtype
+
     @property
     def is_multilingual(self):
         return self.dims.n_vocab >= 51865
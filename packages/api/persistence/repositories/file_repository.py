@@ -1,10 +1,12 @@
-import json
+import asyncio
 import logging
 import os
+import wave
 from datetime import datetime
+from pathlib import Path
 from uuid import UUID, uuid4
 
-from pydub import AudioSegment
+import orjson
 
 from ...domain.memory_request import MemoryRequest, MemoryType
 from .repository_interface import Repository
@@ -13,16 +15,26 @@ from .repository_interface import Repository
 FILE_URI_SCHEME = "file://"
 
 
+def _write_wav(filepath: Path, audio_data: bytes, sample_rate: int) -> None:
+    """Write PCM signed 16-bit little-endian mono audio to a wav file."""
+    with wave.open(str(filepath), "wb") as wav_file:
+        wav_file.setnchannels(1)  # Mono audio
+        wav_file.setsampwidth(2)  # 2 bytes for s16le
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(audio_data)
+
+
 class FileRepository(Repository):
     """Repository implementation that stores memories in the filesystem."""
 
     def __init__(self, storage_dir: str = "recordings", sample_rate: int = 16000):
         self.storage_dir = storage_dir
         self.sample_rate = sample_rate
+        self._storage_path = Path(storage_dir)
+        self._storage_abs = os.path.abspath(storage_dir)
 
         # Ensure the storage directory exists
-        if not os.path.exists(self.storage_dir):
-            os.makedirs(self.storage_dir)
+        self._storage_path.mkdir(parents=True, exist_ok=True)
 
         logging.info(f"Initialized FileRepository with storage dir: {self.storage_dir}")
 
@@ -33,38 +45,36 @@ class FileRepository(Repository):
             memory.id = uuid4()
 
         # Save audio file
-        audio_filename = f"{memory.id}.wav"
-        audio_filepath = os.path.join(self.storage_dir, audio_filename)
+        audio_filepath = self._storage_path / f"{memory.id}.wav"
 
         try:
-            # PCM signed 16-bit little-endian format
+            writes = []
             duration_seconds = 0
             if memory.audio_data:
-                audio_segment = AudioSegment(
-                    data=memory.audio_data,
-                    sample_width=2,  # 2 bytes for s16le
-                    frame_rate=self.sample_rate,
-                    channels=1,  # Mono audio
+                writes.append(
+                    asyncio.to_thread(
+                        _write_wav, audio_filepath, memory.audio_data, self.sample_rate
+                    )
                 )
-                audio_segment.export(audio_filepath, format="wav")
-                logging.info(f"Audio saved to {audio_filepath}")
-
-                duration_seconds = len(audio_segment) / 1000
+                # Duration in milliseconds precision, 2 bytes per mono s16le frame
+                frame_count = len(memory.audio_data) // 2
+                duration_seconds = round(1000 * frame_count / self.sample_rate) / 1000
 
             # Save metadata (could be used for searching later)
-            metadata_filename = f"{memory.id}.json"
-            metadata_filepath = os.path.join(self.storage_dir, metadata_filename)
-            with open(metadata_filepath, "w") as f:
-                json.dump(
-                    {
-                        "id": str(memory.id),
-                        "timestamp": memory.timestamp.isoformat(),
-                        "duration_seconds": duration_seconds,
-                        "text": memory.text,
-                        "memory_type": memory.memory_type.value,
-                    },
-                    f,
-                )
+            metadata_filepath = self._storage_path / f"{memory.id}.json"
+            metadata = orjson.dumps({
+                "id": str(memory.id),
+                "timestamp": memory.timestamp.isoformat(),
+                "duration_seconds": duration_seconds,
+                "text": memory.text,
+                "memory_type": memory.memory_type.value,
+            })
+            writes.append(asyncio.to_thread(metadata_filepath.write_bytes, metadata))
+
+            # Audio and metadata files are independent, write them concurrently
+            await asyncio.gather(*writes)
+            if memory.audio_data:
+                logging.info(f"Audio saved to {audio_filepath}")
 
             return f"{FILE_URI_SCHEME}{audio_filepath}"
 
@@ -74,14 +84,13 @@ class FileRepository(Repository):
 
     async def find_by_uri(self, uri: str) -> MemoryRequest | None:
         """Find a memory by its URI."""
-        if not uri.startswith(FILE_URI_SCHEME):
+        audio_filepath = uri.removeprefix(FILE_URI_SCHEME)
+        if len(audio_filepath) == len(uri):
             raise ValueError(f"Unsupported URI scheme: {uri}")
-        audio_filepath = uri[len(FILE_URI_SCHEME) :]
 
         # Security check: Ensure the file is within the storage directory
         audio_abs_path = os.path.abspath(audio_filepath)
-        storage_abs_path = os.path.abspath(self.storage_dir)
-        if not audio_abs_path.startswith(storage_abs_path):
+        if os.path.commonpath([audio_abs_path, self._storage_abs]) != self._storage_abs:
             logging.warning(
                 "Security violation: Attempted to access file "
                 f"outside storage directory: {audio_filepath}"
@@ -90,32 +99,34 @@ class FileRepository(Repository):
                 "Access denied: Cannot access files outside the storage directory"
             )
 
-        id = os.path.splitext(os.path.basename(audio_filepath))[0]
-        metadata_filepath = os.path.join(self.storage_dir, f"{id}.json")
-
-        if not os.path.exists(audio_filepath):
-            return None
+        id = Path(audio_filepath).stem
+        metadata_filepath = self._storage_path / f"{id}.json"
 
         try:
-            # Load audio data
-            audio_segment = AudioSegment.from_wav(audio_filepath)
-            audio_data = audio_segment.raw_data
+            # Load raw PCM frames straight from the wav file
+            try:
+                with wave.open(audio_filepath, "rb") as wav_file:
+                    audio_data = wav_file.readframes(wav_file.getnframes())
+            except FileNotFoundError:
+                return None
 
             # Load metadata if available
             text = []
             timestamp = None
             memory_type = MemoryType.MEMORY  # Default to memory type
 
-            assert os.path.exists(metadata_filepath)
-            with open(metadata_filepath) as f:
-                metadata = json.load(f)
-                if "text" in metadata:
-                    text = metadata["text"]
-                if "timestamp" in metadata:
-                    timestamp = datetime.fromisoformat(metadata["timestamp"])
-                if "memory_type" in metadata:
-                    # Convert the integer value back to enum
-                    memory_type = MemoryType(metadata["memory_type"])
+            try:
+                metadata = orjson.loads(metadata_filepath.read_bytes())
+            except FileNotFoundError:
+                metadata = {}
+
+            if "text" in metadata:
+                text = metadata["text"]
+            if "timestamp" in metadata:
+                timestamp = datetime.fromisoformat(metadata["timestamp"])
+            if "memory_type" in metadata:
+                # Convert the integer value back to enum
+                memory_type = MemoryType(metadata["memory_type"])
 
             # Fall back to parsing timestamp from ID or using file creation time
             if timestamp is None:
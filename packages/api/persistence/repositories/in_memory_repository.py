@@ -1,5 +1,6 @@
 import logging
-from uuid import UUID, uuid4
+from collections import OrderedDict
+from uuid import uuid4
 
 from ...domain.memory_request import MemoryRequest
 
@@ -15,13 +16,25 @@ class InMemoryRepository(Repository):
 
     Provides fast, temporary storage for memories without persistence.
     Useful for testing and development. All data is lost when the
-    application stops.
+    application stops. When max_items is set, the least recently used
+    memories are evicted once the limit is exceeded.
     """
 
-    def __init__(self):
-        """Initialize the in-memory repository with an empty dictionary."""
-        self.memories: dict[str, MemoryRequest] = {}
-        logging.info("Initialized InMemoryRepository")
+    __slots__ = ("memories", "max_items")
+
+    def __init__(self, max_items: int | None = None):
+        """
+        Initialize the in-memory repository with an empty LRU store.
+
+        Args:
+            max_items (int | None): Maximum number of memories to keep.
+                None keeps every memory.
+        """
+        if max_items is not None and max_items < 1:
+            raise ValueError("max_items must be a positive integer or None")
+        self.memories: OrderedDict[str, MemoryRequest] = OrderedDict()
+        self.max_items = max_items
+        logging.info(f"Initialized InMemoryRepository with max_items={max_items}")
 
     async def save(self, memory: MemoryRequest) -> str:
         """
@@ -33,12 +46,7 @@ class InMemoryRepository(Repository):
         Returns:
             str: URI for the saved memory in format "in_memory://{uuid}"
         """
-        if memory.id is None:
-            memory.id = uuid4()
-
-        self.memories[memory.id] = memory
-        logging.info(f"Memory saved in memory with key: {memory.id}")
-        return f"{IN_MEMORY_URI_SCHEME}{memory.id}"
+        return self._save_sync(memory)
 
     async def find_by_uri(self, uri: str) -> MemoryRequest | None:
         """
@@ -53,12 +61,31 @@ class InMemoryRepository(Repository):
         Raises:
             ValueError: If the URI doesn't have the in_memory:// scheme
         """
-        if not uri.startswith(IN_MEMORY_URI_SCHEME):
+        return self._find_sync(uri)
+
+    # The storage is a plain dict, so the work is done synchronously and the
+    # async methods above only satisfy the Repository interface.
+
+    def _save_sync(self, memory: MemoryRequest) -> str:
+        if memory.id is None:
+            memory.id = uuid4()
+
+        # Key on the canonical id string so lookups never parse a UUID
+        key = str(memory.id)
+        self.memories[key] = memory
+        self.memories.move_to_end(key)
+        if self.max_items is not None and len(self.memories) > self.max_items:
+            evicted_id, _ = self.memories.popitem(last=False)
+            logging.info("Evicted least recently used memory: %s", evicted_id)
+        logging.info("Memory saved in memory with key: %s", key)
+        return f"{IN_MEMORY_URI_SCHEME}{key}"
+
+    def _find_sync(self, uri: str) -> MemoryRequest | None:
+        id = uri.removeprefix(IN_MEMORY_URI_SCHEME)
+        if len(id) == len(uri):
             raise ValueError(f"Invalid in-memory URI: {uri}")
-        id = uri[len(IN_MEMORY_URI_SCHEME) :]
-        memory = self.memories.get(UUID(id))
+        memory = self.memories.get(id)
         if memory:
-            logging.info(f"Memory found with key: {id}")
-        else:
-            logging.info(f"Memory not found with key: {id}")
+            self.memories.move_to_end(id)
+            logging.info("Memory found with key: %s", id)
         return memory
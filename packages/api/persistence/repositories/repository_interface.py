@@ -6,6 +6,8 @@ from ...domain.memory_request import MemoryRequest
 class Repository(ABC):
     """Repository interface for persistence operations."""
 
+    __slots__ = ()
+
     @abstractmethod
     async def save(self, memory: MemoryRequest) -> str:
         """
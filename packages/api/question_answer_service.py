@@ -55,7 +55,7 @@ class QuestionAnswerService:
         """
         session_id = None
         memory_id = None
-        audio_data = bytearray()
+        audio_chunks: list[bytes] = []
         transcription = []
 
         async for chunk in request_iterator:
@@ -68,29 +68,32 @@ class QuestionAnswerService:
 
             # Accumulate audio data and transcription text
             if chunk.audio_data:
-                audio_data.extend(chunk.audio_data)
+                audio_chunks.append(chunk.audio_data)
             if chunk.text_data:
                 transcription.append(chunk.text_data)
 
             # If this is the final chunk, process and answer the question
             if chunk.metadata and chunk.metadata.is_final:
                 async for response in self._process_question(
-                    audio_data, transcription, session_id, memory_id
+                    audio_chunks, transcription, session_id, memory_id
                 ):
                     yield response
 
                 # Reset for next question within the same connection
-                audio_data = bytearray()
+                audio_chunks = []
                 transcription = []
                 session_id = None
                 memory_id = None
 
-    async def _process_question(self, audio_data, transcription, session_id, memory_id):
+    async def _process_question(
+        self, audio_chunks, transcription, session_id, memory_id
+    ):
         """
         Process a question, fetch context, and stream answer.
 
         Args:
-            audio_data (bytearray): Raw audio bytes (if question was spoken)
+            audio_chunks (list[bytes]): Raw audio byte chunks (if question
+                was spoken)
             transcription (list[str]): List of transcribed text segments
                 forming the question
             session_id (str): Session identifier for the client connection
@@ -99,15 +102,22 @@ class QuestionAnswerService:
         Yields:
             MemoryChunk: Stream of relevant memories followed by generated answer chunks
         """
-        full_transcription = " ".join(transcription)
-        logging.info(f"Processing question: {full_transcription}")
-
         # Create question memory object
         question_memory = MemoryRequest.create(
-            audio_data=bytes(audio_data) if audio_data else None,
+            audio_data=b"".join(audio_chunks) if audio_chunks else None,
             text=transcription,
             memory_type=MemoryType.QUESTION,
         )
+        # full_text is cached on the request and reused by the search below
+        logging.info("Processing question: %s", question_memory.full_text)
+
+        # Shared metadata for every memory/answer chunk, copied into each chunk
+        memory_metadata = stt_pb2.ChunkMetadata(
+            session_id=session_id, type=stt_pb2.ChunkType.MEMORY
+        )
+        answer_metadata = stt_pb2.ChunkMetadata(
+            session_id=session_id, type=stt_pb2.ChunkType.ANSWER
+        )
 
         # Get memory context
         memory_context = await self.vector_store_service.search(
@@ -131,53 +141,47 @@ class QuestionAnswerService:
             for memory in filtered_context.memories.values():
                 # Create the memory chunk using the factory method
                 memory_chunk = memory.to_chunk(
-                    session_id=session_id, chunk_type=stt_pb2.ChunkType.MEMORY
+                    session_id=session_id, metadata_template=memory_metadata
                 )
 
                 # Then add the score from filtered_context
-                if memory.id in filtered_context.scores:
-                    memory_chunk.metadata.score = float(
-                        filtered_context.scores[memory.id]
-                    )
+                score = filtered_context.scores.get(memory.id)
+                if score is not None:
+                    memory_chunk.metadata.score = float(score)
 
                 yield memory_chunk
 
         # Stream answer chunks
         try:
-            last_chunk = None
+            memory_chunk_cls = stt_pb2.MemoryChunk
+            last_memory_id: str | None = None
+            sent_final = False
             async for response_chunk in response_generator:
                 if response_chunk.response and response_chunk.response.text:
-                    chunks_count = len(response_chunk.response.text)
-                    for i, text_segment in enumerate(response_chunk.response.text):
-                        if text_segment.strip():
-                            is_final = (
-                                i == chunks_count - 1
-                                and response_chunk.metadata.get("is_final", False)
-                            )
-
-                            answer_chunk = stt_pb2.MemoryChunk(
-                                text_data=text_segment,
-                                metadata=stt_pb2.ChunkMetadata(
-                                    session_id=session_id,
-                                    memory_id=str(response_chunk.response.id),
-                                    type=stt_pb2.ChunkType.ANSWER,
-                                    is_final=is_final,
-                                ),
-                            )
-                            last_chunk = answer_chunk
+                    # Invariant for all text segments of this response chunk
+                    segments = response_chunk.response.text
+                    last_index = len(segments) - 1
+                    response_id = str(response_chunk.response.id)
+                    response_final = response_chunk.metadata.get("is_final", False)
+                    for i, text_segment in enumerate(segments):
+                        if text_segment and not text_segment.isspace():
+                            is_final = i == last_index and response_final
+                            answer_chunk = memory_chunk_cls(text_data=text_segment)
+                            metadata = answer_chunk.metadata
+                            metadata.CopyFrom(answer_metadata)
+                            metadata.memory_id = response_id
+                            metadata.is_final = is_final
+                            last_memory_id = response_id
+                            sent_final = bool(is_final)
                             yield answer_chunk
 
             # If the generator finishes and the last chunk sent was not final,
             # -> send a final marker.
-            if last_chunk and not last_chunk.metadata.is_final:
-                final_marker = stt_pb2.MemoryChunk(
-                    metadata=stt_pb2.ChunkMetadata(
-                        session_id=session_id,
-                        memory_id=last_chunk.metadata.memory_id,
-                        type=stt_pb2.ChunkType.ANSWER,
-                        is_final=True,
-                    )
-                )
+            if last_memory_id is not None and not sent_final:
+                final_marker = memory_chunk_cls()
+                final_marker.metadata.CopyFrom(answer_metadata)
+                final_marker.metadata.memory_id = last_memory_id
+                final_marker.metadata.is_final = True
                 yield final_marker
                 logging.info("Sent final answer marker because stream ended.")
 
@@ -1,10 +1,17 @@
+import hashlib
 import logging
+import time
+from collections import OrderedDict
 from collections.abc import AsyncIterator
 
 from ..domain.memory_context import MemoryContext
-from ..domain.memory_request import MemoryRequest
+from ..domain.memory_request import MemoryRequest, MemoryType
 
 from ..models.llm.llm_model_interface import LLMModel, MemoryResponse
+from .simple_rag_service import NO_MEMORIES_ANSWER
+
+# Text segments, model name, tokens used and metadata of one streamed chunk
+CachedChunk = tuple[tuple[str, ...], str, int, dict]
 
 
 class LLMRAGService:
@@ -13,14 +20,28 @@ class LLMRAGService:
     memories retrieved from a vector store.
     """
 
-    def __init__(self, llm_model: LLMModel):
+    def __init__(
+        self,
+        llm_model: LLMModel,
+        answer_cache_size: int = 0,
+        answer_cache_ttl: float = 60.0,
+    ):
         """
         Initialize the RAG service with an LLM model.
 
         Args:
             llm_model: The LLM model to use for generating responses
+            answer_cache_size: Number of complete answers to keep for repeated
+                questions over the same memories. 0 disables the cache.
+            answer_cache_ttl: Seconds a cached answer stays valid
         """
         self.llm_model = llm_model
+        self.answer_cache_size = answer_cache_size
+        self.answer_cache_ttl = answer_cache_ttl
+        # LRU of cache key -> (expiry time, streamed chunk fields)
+        self._answer_cache: OrderedDict[str, tuple[float, list[CachedChunk]]] = (
+            OrderedDict()
+        )
 
     async def answer_question(
         self,
@@ -41,14 +62,47 @@ class LLMRAGService:
         Yields:
             MemoryResponse: Streaming chunks of the generated answer
         """
-        logging.info(f"Processing question: {query.text}")
+        logging.info("Processing question: %s", query.text)
+
+        # Reuse the joined question text as the prompt
+        prompt = query.full_text
+
+        # Without any memories there is nothing to ground the answer in, so
+        # answer right away instead of running the LLM
+        if not memory_context or memory_context.is_empty():
+            logging.info("No memories in context, skipping LLM generation")
+            yield MemoryResponse(
+                response=MemoryRequest.create(
+                    text=[NO_MEMORIES_ANSWER], memory_type=MemoryType.ANSWER
+                ),
+                model_name=getattr(self.llm_model, "model_name", ""),
+                tokens_used=0,
+                metadata={"is_final": True},
+            )
+            return
+
+        logging.info(f"Using {len(memory_context.memories)} memories for context")
 
-        # Join the text list into a single string for the prompt
-        prompt = " ".join(query.text)
+        cache_key = None
+        if self.answer_cache_size:
+            cache_key = self._cache_key(prompt, memory_context, chunk_size_tokens)
+            cached_chunks = self._get_cached_answer(cache_key)
+            if cached_chunks is not None:
+                logging.info("Serving cached answer for repeated question")
+                # Build fresh responses so each replayed answer gets its own ID
+                for text, model_name, tokens_used, metadata in cached_chunks:
+                    yield MemoryResponse(
+                        response=MemoryRequest.create(
+                            text=list(text), memory_type=MemoryType.ANSWER
+                        ),
+                        model_name=model_name,
+                        tokens_used=tokens_used,
+                        metadata=dict(metadata),
+                    )
+                return
 
-        # Log the number of memories in the context
-        if memory_context and not memory_context.is_empty():
-            logging.info(f"Using {len(memory_context.memories)} memories for context")
+        streamed_chunks: list[CachedChunk] = []
+        last_chunk: MemoryResponse | None = None
 
         # Stream responses directly without accumulating
         async for chunk in self.llm_model.generate_with_memory(
@@ -56,9 +110,54 @@ class LLMRAGService:
             memory_context=memory_context,
             chunk_size_tokens=chunk_size_tokens,
         ):
-            # Log tokens used for monitoring
-            if chunk.metadata.get("is_final", False):
-                logging.info(f"LLM response completed: {chunk.tokens_used} tokens used")
+            last_chunk = chunk
+            if cache_key is not None:
+                streamed_chunks.append((
+                    tuple(chunk.response.text),
+                    chunk.model_name,
+                    chunk.tokens_used,
+                    dict(chunk.metadata),
+                ))
 
             # Pass through each chunk directly to the caller
             yield chunk
+
+        # Only the last chunk can be final, so check it once after streaming
+        if last_chunk is not None and last_chunk.metadata.get("is_final", False):
+            logging.info(
+                f"LLM response completed: {last_chunk.tokens_used} tokens used"
+            )
+            if cache_key is not None:
+                self._store_cached_answer(cache_key, streamed_chunks)
+
+    @staticmethod
+    def _cache_key(
+        prompt: str, memory_context: MemoryContext, chunk_size_tokens: int
+    ) -> str:
+        # Feed the hash piece by piece instead of building one large string
+        key_hash = hashlib.blake2b(digest_size=16)
+        key_hash.update(f"{chunk_size_tokens}|{prompt}".encode())
+        for memory_id in sorted(map(str, memory_context.memories)):
+            key_hash.update(b"|")
+            key_hash.update(memory_id.encode())
+        return key_hash.hexdigest()
+
+    def _get_cached_answer(self, cache_key: str) -> list[CachedChunk] | None:
+        entry = self._answer_cache.get(cache_key)
+        if entry is None:
+            return None
+        expires_at, chunks = entry
+        if expires_at < time.monotonic():
+            del self._answer_cache[cache_key]
+            return None
+        self._answer_cache.move_to_end(cache_key)
+        return chunks
+
+    def _store_cached_answer(self, cache_key: str, chunks: list[CachedChunk]) -> None:
+        self._answer_cache[cache_key] = (
+            time.monotonic() + self.answer_cache_ttl,
+            chunks,
+        )
+        self._answer_cache.move_to_end(cache_key)
+        if len(self._answer_cache) > self.answer_cache_size:
+            self._answer_cache.popitem(last=False)
@@ -1,9 +1,45 @@
+import functools
 import logging
 from datetime import datetime
 
 from ..domain.memory_context import MemoryContext
 from ..domain.memory_request import MemoryRequest, MemoryType
 
+NO_MEMORIES_ANSWER = (
+    "I don't have any memories that match your question. "
+    + "Try asking about something you've recorded before."
+)
+
+
+# English month names, so formatting does not depend on the process locale
+_MONTHS = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_timestamp(timestamp: datetime | str) -> str:
+    """Format a memory timestamp as e.g. "March 05, 2024 at 02:30 PM"."""
+    if isinstance(timestamp, str):
+        timestamp = datetime.fromisoformat(timestamp)
+    hour = timestamp.hour % 12 or 12
+    period = "AM" if timestamp.hour < 12 else "PM"
+    return (
+        f"{_MONTHS[timestamp.month - 1]} {timestamp.day:02d}, {timestamp.year} "
+        f"at {hour:02d}:{timestamp.minute:02d} {period}"
+    )
+
 
 class SimpleRAGService:
     """
@@ -32,25 +68,16 @@ class SimpleRAGService:
 
         # Generate answer based on retrieved memories
         if not memory_context.memories:
-            answer_text = (
-                "I don't have any memories that match your question. "
-                + "Try asking about something you've recorded before."
-            )
+            answer_text = NO_MEMORIES_ANSWER
         else:
-            answer_parts = ["Based on your memories, here's what I found:"]
-
-            for i, memory in enumerate(memory_context.memories.values(), 1):
-                # Format the timestamp nicely
-                timestamp = (
-                    datetime.fromisoformat(memory.timestamp)
-                    if isinstance(memory.timestamp, str)
-                    else memory.timestamp
-                )
-                formatted_date = timestamp.strftime("%B %d, %Y at %I:%M %p")
-
-                answer_parts.append(f"{i}. From {formatted_date}: {memory.text}")
-
-            answer_text = "\n\n".join(answer_parts)
+            # Build the memory lines in one comprehension and join them once
+            answer_parts = [
+                f"{i}. From {_format_timestamp(memory.timestamp)}: {memory.text}"
+                for i, memory in enumerate(memory_context.memories.values(), 1)
+            ]
+            answer_text = "Based on your memories, here's what I found:\n\n" + (
+                "\n\n".join(answer_parts)
+            )
 
         # Create a new MemoryRequest for the answer
         answer_request = MemoryRequest.create(
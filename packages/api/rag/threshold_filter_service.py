@@ -1,7 +1,13 @@
 import logging
 
+import numpy as np
+
 from ..domain.memory_context import MemoryContext
 
+# Contexts with at least this many scores are compared in one NumPy pass;
+# smaller ones are cheaper to filter in plain Python
+VECTORIZED_FILTER_MIN_SIZE = 256
+
 
 class ThresholdFilterService:
     """
@@ -35,16 +41,15 @@ class ThresholdFilterService:
             logging.info("No scores available in context, returning original context")
             return context
 
-        original_count = len(context.get_memory_objects())
-
         # Apply relevance threshold filter
         filtered_context = self._apply_relevance_threshold(context)
 
-        filtered_count = len(filtered_context.get_memory_objects())
-
+        # Count the dicts directly instead of copying them into lists
         logging.info(
-            f"Filtered context from {original_count} to {filtered_count} memories "
-            f"above threshold {self.relevance_threshold}"
+            "Filtered context from %d to %d memories above threshold %s",
+            len(context.memories),
+            len(filtered_context.memories),
+            self.relevance_threshold,
         )
 
         return filtered_context
@@ -54,21 +59,19 @@ class ThresholdFilterService:
         if not context.scores:
             return context
 
-        # Filter memories that meet the threshold
+        scores = context.scores
+        filtered_scores = self._scores_above_threshold(scores)
+
+        # Walk memories and matched texts in their own order, using the kept
+        # scores as a membership test. Unscored memories count as 0.0, so they
+        # are only kept when the threshold does not exceed that.
+        keep_unscored = self.relevance_threshold <= 0.0
         filtered_memories = {
             memory_id: memory
             for memory_id, memory in context.memories.items()
-            if context.scores.get(memory_id, 0.0) >= self.relevance_threshold
+            if memory_id in filtered_scores
+            or (keep_unscored and memory_id not in scores)
         }
-
-        # Filter corresponding scores
-        filtered_scores = {
-            memory_id: score
-            for memory_id, score in context.scores.items()
-            if score >= self.relevance_threshold
-        }
-
-        # Filter corresponding matched texts
         filtered_matched_texts = {
             memory_id: text
             for memory_id, text in context.matched_texts.items()
@@ -85,6 +88,21 @@ class ThresholdFilterService:
 
         return filtered_context
 
+    def _scores_above_threshold(self, scores: dict[str, float]) -> dict[str, float]:
+        """Return the scores that meet the threshold, in their original order."""
+        threshold = self.relevance_threshold
+        if len(scores) < VECTORIZED_FILTER_MIN_SIZE:
+            return {
+                memory_id: score
+                for memory_id, score in scores.items()
+                if score >= threshold
+            }
+
+        ids = list(scores)
+        values = np.fromiter(scores.values(), dtype=np.float64, count=len(ids))
+        kept = np.flatnonzero(values >= threshold)
+        return {ids[i]: scores[ids[i]] for i in kept.tolist()}
+
     def set_threshold(self, new_threshold: float) -> None:
         """
         Update the relevance threshold.
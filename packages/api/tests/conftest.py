@@ -0,0 +1,17 @@
+import asyncio
+import sys
+
+import pytest
+
+if sys.platform == "win32":  # uvloop does not support Windows
+    uvloop = None
+else:
+    import uvloop
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run the async tests on uvloop outside of Windows."""
+    if uvloop is None:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
@@ -1,5 +1,3 @@
-import asyncio
-
 import pytest
 from ....domain.memory_request import MemoryRequest
 from ....persistence.repositories.file_repository import FILE_URI_SCHEME, FileRepository
@@ -11,14 +9,33 @@ def file_repository(tmp_path):
     return FileRepository(storage_dir=str(tmp_path))
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_memory():
     return MemoryRequest.create(audio_data=b"audio data", text=["hello", "world"])
 
 
-def test_save_memory_file(file_repository, sample_memory):
-    uri = asyncio.run(file_repository.save(sample_memory))
+@pytest.mark.asyncio
+async def test_save_memory_file(file_repository, sample_memory):
+    uri = await file_repository.save(sample_memory)
     assert uri.startswith(FILE_URI_SCHEME)
-    loaded = asyncio.run(file_repository.find_by_uri(uri))
+    loaded = await file_repository.find_by_uri(uri)
     assert loaded is not None
     assert loaded.id == sample_memory.id
+    assert loaded.audio_data == sample_memory.audio_data
+    assert loaded.text == sample_memory.text
+
+
+@pytest.mark.asyncio
+async def test_find_by_uri_rejects_sibling_directory_with_same_prefix(tmp_path):
+    storage_dir = tmp_path / "storage"
+    repository = FileRepository(storage_dir=str(storage_dir))
+    outside_file = tmp_path / "storagex" / "memory.wav"
+
+    with pytest.raises(ValueError):
+        await repository.find_by_uri(f"{FILE_URI_SCHEME}{outside_file}")
+
+
+@pytest.mark.asyncio
+async def test_find_by_uri_rejects_other_schemes(file_repository):
+    with pytest.raises(ValueError):
+        await file_repository.find_by_uri("in_memory://memory-id")
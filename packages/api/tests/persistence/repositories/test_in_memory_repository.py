@@ -1,4 +1,3 @@
-import asyncio
 from uuid import uuid4
 
 import pytest
@@ -14,15 +13,41 @@ def in_memory_repository():
     return InMemoryRepository()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_memory():
     return MemoryRequest.create(
         id=uuid4(), audio_data=b"audio data", text=["hello", "world"]
     )
 
 
-def test_save_memory_in_memory(in_memory_repository, sample_memory):
-    uri = asyncio.run(in_memory_repository.save(sample_memory))
+@pytest.mark.asyncio
+async def test_save_memory_in_memory(in_memory_repository, sample_memory):
+    uri = await in_memory_repository.save(sample_memory)
     assert uri.startswith(IN_MEMORY_URI_SCHEME)
-    loaded = asyncio.run(in_memory_repository.find_by_uri(uri))
+    loaded = await in_memory_repository.find_by_uri(uri)
     assert loaded == sample_memory
+
+
+@pytest.mark.asyncio
+async def test_in_memory_repository_evicts_least_recently_used():
+    repository = InMemoryRepository(max_items=2)
+    memories = [
+        MemoryRequest.create(id=uuid4(), audio_data=b"", text=[f"memory {i}"])
+        for i in range(3)
+    ]
+
+    first_uri = await repository.save(memories[0])
+    second_uri = await repository.save(memories[1])
+    # Touch the first memory so the second becomes least recently used
+    assert (await repository.find_by_uri(first_uri)) == memories[0]
+    third_uri = await repository.save(memories[2])
+
+    assert (await repository.find_by_uri(second_uri)) is None
+    assert (await repository.find_by_uri(first_uri)) == memories[0]
+    assert (await repository.find_by_uri(third_uri)) == memories[2]
+
+
+@pytest.mark.asyncio
+async def test_find_by_uri_rejects_other_schemes(in_memory_repository):
+    with pytest.raises(ValueError):
+        await in_memory_repository.find_by_uri("file://recordings/memory.wav")
@@ -22,7 +22,7 @@ def persistence_service(mock_repository):
     return PersistenceService(mock_repository)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_memory():
     return MemoryRequest.create(audio_data=b"audio data", text=["hello", "world"])
 
@@ -0,0 +1,111 @@
+import pytest
+from ...domain.memory_context import MemoryContext
+from ...domain.memory_request import MemoryRequest, MemoryType
+from ...models.llm.llm_model_interface import LLMModel, MemoryResponse
+from ...rag.llm_rag_service import LLMRAGService
+from ...rag.simple_rag_service import NO_MEMORIES_ANSWER
+
+
+class FakeLLMModel(LLMModel):
+    """LLM model that streams a fixed answer and counts generations."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def generate_with_memory(self, prompt, memory_context, chunk_size_tokens=1):
+        self.calls += 1
+        for index, text in enumerate(["Hello", "world"]):
+            yield MemoryResponse(
+                response=MemoryRequest.create(
+                    text=[text], memory_type=MemoryType.ANSWER
+                ),
+                model_name="fake",
+                tokens_used=index + 1,
+                metadata={"is_final": index == 1},
+            )
+
+
+def build_context(*memory_ids: str) -> MemoryContext:
+    """Build a context holding one memory per ID."""
+    context = MemoryContext.create()
+    for memory_id in memory_ids:
+        memory = MemoryRequest.create(id=memory_id, text=[memory_id])
+        context.add_memory(memory, 1.0, memory_id)
+    return context
+
+
+async def collect_answer(service, question, context):
+    """Return the text of every streamed chunk."""
+    query = MemoryRequest.create(text=[question], memory_type=MemoryType.QUESTION)
+    return [
+        chunk.response.text[0]
+        async for chunk in service.answer_question(query, context)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_answer_question_reuses_cached_answer():
+    """A repeated question over the same memories skips the LLM."""
+    llm_model = FakeLLMModel()
+    service = LLMRAGService(llm_model=llm_model, answer_cache_size=4)
+
+    first = await collect_answer(service, "What?", build_context("a", "b"))
+    second = await collect_answer(service, "What?", build_context("b", "a"))
+
+    assert first == second == ["Hello", "world"]
+    assert llm_model.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_answer_question_cached_answer_gets_new_ids():
+    """A replayed answer does not reuse the IDs of the first answer."""
+    service = LLMRAGService(llm_model=FakeLLMModel(), answer_cache_size=4)
+    query = MemoryRequest.create(text=["What?"], memory_type=MemoryType.QUESTION)
+
+    first = [
+        chunk.response.id
+        async for chunk in service.answer_question(query, build_context("a"))
+    ]
+    second = [
+        chunk.response.id
+        async for chunk in service.answer_question(query, build_context("a"))
+    ]
+
+    assert len(second) == len(first) == 2
+    assert set(first).isdisjoint(second)
+
+
+@pytest.mark.asyncio
+async def test_answer_question_cache_misses_on_different_memories():
+    """The same question over other memories generates a new answer."""
+    llm_model = FakeLLMModel()
+    service = LLMRAGService(llm_model=llm_model, answer_cache_size=4)
+
+    await collect_answer(service, "What?", build_context("a"))
+    await collect_answer(service, "What?", build_context("c"))
+
+    assert llm_model.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_answer_question_cache_disabled_by_default():
+    """Without a cache size every question reaches the LLM."""
+    llm_model = FakeLLMModel()
+    service = LLMRAGService(llm_model=llm_model)
+
+    await collect_answer(service, "What?", build_context("a"))
+    await collect_answer(service, "What?", build_context("a"))
+
+    assert llm_model.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_answer_question_without_memories_skips_llm():
+    """An empty context is answered without running the LLM."""
+    llm_model = FakeLLMModel()
+    service = LLMRAGService(llm_model=llm_model)
+
+    answer = await collect_answer(service, "What?", MemoryContext.create())
+
+    assert answer == [NO_MEMORIES_ANSWER]
+    assert llm_model.calls == 0
@@ -0,0 +1,22 @@
+from datetime import datetime
+
+import pytest
+from ...rag.simple_rag_service import _format_timestamp
+
+
+@pytest.mark.parametrize(
+    "timestamp",
+    [
+        datetime(2024, 3, 5, 0, 7),
+        datetime(2024, 3, 5, 11, 59),
+        datetime(2024, 12, 31, 12, 0),
+        datetime(2025, 7, 14, 23, 30),
+    ],
+)
+def test_format_timestamp_matches_strftime(timestamp):
+    """The hand-rolled format matches strftime in an English locale."""
+    assert _format_timestamp(timestamp) == timestamp.strftime("%B %d, %Y at %I:%M %p")
+
+
+def test_format_timestamp_parses_iso_strings():
+    assert _format_timestamp("2024-03-05T14:30:00") == "March 05, 2024 at 02:30 PM"
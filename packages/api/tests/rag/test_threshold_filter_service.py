@@ -0,0 +1,63 @@
+import pytest
+from ...domain.memory_context import MemoryContext
+from ...domain.memory_request import MemoryRequest
+from ...rag.threshold_filter_service import (
+    VECTORIZED_FILTER_MIN_SIZE,
+    ThresholdFilterService,
+)
+
+
+def build_context(scores: list[float]) -> MemoryContext:
+    """Build a context with one memory per score."""
+    context = MemoryContext.create()
+    for index, score in enumerate(scores):
+        memory = MemoryRequest.create(id=f"memory-{index}", text=[f"text {index}"])
+        context.add_memory(memory, score, f"match {index}")
+    return context
+
+
+@pytest.mark.parametrize(
+    "size", [VECTORIZED_FILTER_MIN_SIZE - 1, VECTORIZED_FILTER_MIN_SIZE]
+)
+def test_filter_context_keeps_scores_at_or_above_threshold(size):
+    """Both the Python and the NumPy path keep the same memories, in order."""
+    scores = [(index % 10) / 10 for index in range(size)]
+    context = build_context(scores)
+
+    filtered = ThresholdFilterService(relevance_threshold=0.7).filter_context(context)
+
+    expected_ids = [
+        f"memory-{index}" for index, score in enumerate(scores) if score >= 0.7
+    ]
+    assert list(filtered.scores) == expected_ids
+    assert list(filtered.memories) == expected_ids
+    assert list(filtered.matched_texts) == expected_ids
+    assert filtered.query_memory is context.query_memory
+
+
+@pytest.mark.parametrize(
+    ("threshold", "expected_ids"),
+    [(0.0, ["unscored", "memory-0"]), (0.5, ["memory-0"])],
+)
+def test_filter_context_treats_unscored_memories_as_zero(threshold, expected_ids):
+    """Memories without a score follow the order of memories and score 0.0."""
+    context = MemoryContext.create()
+    context.memories["unscored"] = MemoryRequest.create(
+        id="unscored", text=["no score"]
+    )
+    memory = MemoryRequest.create(id="memory-0", text=["text 0"])
+    context.add_memory(memory, 0.9, "match 0")
+
+    filtered = ThresholdFilterService(relevance_threshold=threshold).filter_context(
+        context
+    )
+
+    assert list(filtered.memories) == expected_ids
+    assert list(filtered.scores) == ["memory-0"]
+
+
+def test_filter_context_returns_empty_context_unchanged():
+    """A context without scores is returned as is."""
+    context = MemoryContext.create()
+
+    assert ThresholdFilterService().filter_context(context) is context
@@ -1,7 +1,9 @@
 from dataclasses import dataclass
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
 from fastapi import WebSocketDisconnect
 
 from .. import main
@@ -27,13 +29,103 @@ class DummyContainer:
     retrieval_limit: int = RETRIEVAL_LIMIT
 
 
-@pytest.fixture
-def container():
-    """Single mock container with all service doubles."""
-    # Transcriber
-    transcriber = MagicMock()
-    transcriber.initialize.return_value = None
-    transcriber.transcribe.return_value = ([MagicMock(text="test")], None)
+# ----------------------------
+# Shared protobuf payloads (built and serialized once per module)
+# ----------------------------
+
+MEMORY_AUDIO_CHUNK = MemoryChunk(
+    audio_data=bytes(DummyContainer.sample_rate * 4),
+    metadata=ChunkMetadata(
+        type=ChunkType.MEMORY, session_id="test_session", memory_id="test-memory-id"
+    ),
+)
+MEMORY_FINAL_CHUNK = MemoryChunk(
+    metadata=ChunkMetadata(
+        type=ChunkType.MEMORY,
+        session_id="test_session",
+        memory_id="test-memory-id",
+        is_final=True,
+    )
+)
+QUESTION_TEXT_CHUNK = MemoryChunk(
+    text_data="Hello, this is a test question.",
+    metadata=ChunkMetadata(
+        type=ChunkType.QUESTION,
+        session_id="test_question_session",
+        memory_id="test-memory-id",
+    ),
+)
+QUESTION_FINAL_CHUNK = MemoryChunk(
+    metadata=ChunkMetadata(
+        type=ChunkType.QUESTION,
+        session_id="test_question_session",
+        memory_id="test-memory-id",
+        is_final=True,
+    )
+)
+
+MEMORY_AUDIO_CHUNK_BYTES = MEMORY_AUDIO_CHUNK.SerializeToString()
+MEMORY_FINAL_CHUNK_BYTES = MEMORY_FINAL_CHUNK.SerializeToString()
+QUESTION_TEXT_CHUNK_BYTES = QUESTION_TEXT_CHUNK.SerializeToString()
+QUESTION_FINAL_CHUNK_BYTES = QUESTION_FINAL_CHUNK.SerializeToString()
+
+# Frames a WebSocket client sends for one session, ending with a disconnect
+MEMORY_SCENARIO = (
+    MEMORY_AUDIO_CHUNK_BYTES,
+    MEMORY_FINAL_CHUNK_BYTES,
+    WebSocketDisconnect(),
+)
+QUESTION_SCENARIO = (
+    QUESTION_TEXT_CHUNK_BYTES,
+    QUESTION_FINAL_CHUNK_BYTES,
+    WebSocketDisconnect(),
+)
+
+
+# ----------------------------
+# Shared RAG answer double
+# ----------------------------
+
+
+# Built once per module; the question tests only read it
+RAG_ANSWER_RESPONSE = SimpleNamespace(
+    response=SimpleNamespace(text=["test answer"], id="answer-id"),
+    metadata={"is_final": True},
+    tokens_used=10,
+)
+
+
+async def rag_answer_stream(*args, **kwargs):
+    """Stand-in for rag.answer_question streaming a single final answer."""
+    yield RAG_ANSWER_RESPONSE
+
+
+class StubTranscriber:
+    """Transcriber double that returns one fixed segment per chunk."""
+
+    def initialize(self):
+        pass
+
+    def reset_state(self):
+        pass
+
+    def transcribe(self, audio):
+        return [SimpleNamespace(text="test")], None
+
+
+class PassThroughThresholdFilter:
+    """Threshold filter double that keeps every memory."""
+
+    def filter_context(self, context):
+        return context
+
+
+@pytest.fixture(scope="module")
+def shared_container():
+    """Single mock container with all service doubles, built once per module."""
+    # Transcriber and threshold filter are never asserted on, so plain stubs
+    # replace the mocks
+    transcriber = StubTranscriber()
 
     # Persistence
     persistence = MagicMock()
@@ -48,8 +140,7 @@ def container():
     rag = MagicMock()
 
     # Threshold filter
-    threshold_filter = MagicMock()
-    threshold_filter.filter_context = MagicMock()
+    threshold_filter = PassThroughThresholdFilter()
 
     return DummyContainer(
         transcriber=transcriber,
@@ -61,27 +152,51 @@ def container():
 
 
 @pytest.fixture
-def servicer(container):
-    """Service under test with DI'd container."""
-    return main.TranscriptionServiceServicer(container)
+def container(shared_container):
+    """Shared mock container, reset to its default wiring before each test."""
+    # Clear calls plus any return values or side effects a previous test set
+    for service in (
+        shared_container.persistence,
+        shared_container.vector_store,
+        shared_container.rag,
+    ):
+        service.reset_mock(return_value=True, side_effect=True)
+
+    shared_container.persistence.save_memory.return_value = "test-uri"
+    shared_container.vector_store.index_memory.return_value = None
+    return shared_container
 
 
 @pytest.fixture
-def memory_servicer(container):
+def rag_container(container):
+    """Container whose search finds nothing and whose RAG streams one answer."""
+    container.vector_store.search.return_value = MemoryContext.create()
+    container.rag.answer_question = MagicMock(side_effect=rag_answer_stream)
+    return container
+
+
+@pytest.fixture(scope="module")
+def servicer(shared_container):
+    """Service under test with DI'd container."""
+    return main.TranscriptionServiceServicer(shared_container)
+
+
+@pytest.fixture(scope="module")
+def memory_servicer(shared_container):
     """Memory persistence service under test with DI'd container."""
-    return main.MemoryPersistService(container)
+    return main.MemoryPersistService(shared_container)
 
 
-@pytest.fixture
-def qa_servicer(container):
+@pytest.fixture(scope="module")
+def qa_servicer(shared_container):
     """Question answering service under test with DI'd container."""
-    return main.QuestionAnswerService(container)
+    return main.QuestionAnswerService(shared_container)
 
 
-@pytest.fixture
-def websocket_handler(container):
+@pytest.fixture(scope="module")
+def websocket_handler(shared_container):
     """WebSocket handler with mocked container."""
-    return main.WebSocketTranscriptionHandler(container)
+    return main.WebSocketTranscriptionHandler(shared_container)
 
 
 @pytest.fixture
@@ -95,19 +210,19 @@ def mock_websocket():
     return websocket
 
 
-@pytest.fixture
-def client():
-    """Test client for FastAPI app."""
-    return TestClient(main.app)
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def client():
+    """Async test client calling the FastAPI app in-process over ASGI."""
+    async with AsyncClient(
+        transport=ASGITransport(app=main.app), base_url="http://test"
+    ) as async_client:
+        yield async_client
 
 
 @pytest.fixture
 def collect_responses():
     async def _collect(request_iterator, service_method, context):
-        out = []
-        async for r in service_method(request_iterator, context):
-            out.append(r)
-        return out
+        return [r async for r in service_method(request_iterator, context)]
 
     return _collect
 
@@ -117,16 +232,18 @@ def collect_responses():
 # ----------------------------
 
 
-def test_health_endpoint(client):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_health_endpoint(client):
     """Test the health check endpoint."""
-    response = client.get("/health")
+    response = await client.get("/health")
     assert response.status_code == 200
     assert response.json() == {"status": "healthy", "service": "momento-ws"}
 
 
-def test_root_endpoint(client):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_root_endpoint(client):
     """Test the root endpoint."""
-    response = client.get("/")
+    response = await client.get("/")
     assert response.status_code == 200
     data = response.json()
     assert data["service"] == "Momento WebSocket API"
@@ -206,44 +323,16 @@ async def test_websocket_message_processing_memory(
     websocket_handler, mock_websocket, container
 ):
     """Test WebSocket message processing for memory transcription."""
-    session_id = "test_session"
-    memory_id = "test-memory-id"
-
-    # Create protobuf messages
-    audio_chunk = MemoryChunk(
-        audio_data=b"\x00" * (container.sample_rate * 4),
-        metadata=ChunkMetadata(
-            type=ChunkType.MEMORY, session_id=session_id, memory_id=memory_id
-        ),
-    )
-    final_chunk = MemoryChunk(
-        metadata=ChunkMetadata(
-            type=ChunkType.MEMORY,
-            session_id=session_id,
-            memory_id=memory_id,
-            is_final=True,
-        )
-    )
-
-    # Mock WebSocket to return our test messages
-    mock_websocket.receive_bytes.side_effect = [
-        audio_chunk.SerializeToString(),
-        final_chunk.SerializeToString(),
-        WebSocketDisconnect(),  # End the loop
-    ]
-
-    # Track what gets sent back
-    sent_messages = []
+    # Mock WebSocket to return our test messages, then disconnect
+    mock_websocket.receive_bytes.side_effect = iter(MEMORY_SCENARIO)
 
-    async def mock_send_bytes(data):
-        chunk = MemoryChunk()
-        chunk.ParseFromString(data)
-        sent_messages.append(chunk)
-
-    mock_websocket.send_bytes.side_effect = mock_send_bytes
+    # Capture the raw frames that get sent back; they are parsed afterwards
+    sent_bytes = []
+    mock_websocket.send_bytes.side_effect = sent_bytes.append
 
     # Run the message processing
     await websocket_handler._process_memory(mock_websocket, id(mock_websocket))
+    sent_messages = [MemoryChunk.FromString(data) for data in sent_bytes]
 
     # Verify that transcription and memory saving occurred
     assert container.persistence.save_memory.awaited
@@ -257,68 +346,19 @@ async def test_websocket_message_processing_memory(
 
 @pytest.mark.asyncio
 async def test_websocket_message_processing_question(
-    websocket_handler, mock_websocket, container
+    websocket_handler, mock_websocket, rag_container
 ):
     """Test WebSocket message processing for question answering."""
-    session_id = "test_question_session"
-    memory_id = "test-memory-id"
-
-    # Setup RAG mock response
-    mock_memory_req = MagicMock()
-    mock_memory_req.text = ["test answer"]
-    mock_memory_req.id = "answer-id"
-
-    mock_memory_response = MagicMock()
-    mock_memory_response.response = mock_memory_req
-    mock_memory_response.metadata = {"is_final": True}
-    mock_memory_response.tokens_used = 10
-
-    # Vector store returns a MemoryContext
-    mock_memory_context = MagicMock(spec=MemoryContext)
-    mock_memory_context.memories = {}
-    container.vector_store.search.return_value = mock_memory_context
-
-    class AsyncGenMock:
-        async def __aiter__(self):
-            yield mock_memory_response
-
-    container.rag.answer_question = MagicMock(return_value=AsyncGenMock())
-
-    # Create protobuf messages
-    text_chunk = MemoryChunk(
-        text_data="Hello, this is a test question.",
-        metadata=ChunkMetadata(
-            type=ChunkType.QUESTION, session_id=session_id, memory_id=memory_id
-        ),
-    )
-    final_chunk = MemoryChunk(
-        metadata=ChunkMetadata(
-            type=ChunkType.QUESTION,
-            session_id=session_id,
-            memory_id=memory_id,
-            is_final=True,
-        )
-    )
-
-    # Mock WebSocket to return our test messages
-    mock_websocket.receive_bytes.side_effect = [
-        text_chunk.SerializeToString(),
-        final_chunk.SerializeToString(),
-        WebSocketDisconnect(),  # End the loop
-    ]
-
-    # Track what gets sent back
-    sent_messages = []
+    # Mock WebSocket to return our test messages, then disconnect
+    mock_websocket.receive_bytes.side_effect = iter(QUESTION_SCENARIO)
 
-    async def mock_send_bytes(data):
-        chunk = MemoryChunk()
-        chunk.ParseFromString(data)
-        sent_messages.append(chunk)
-
-    mock_websocket.send_bytes.side_effect = mock_send_bytes
+    # Capture the raw frames that get sent back; they are parsed afterwards
+    sent_bytes = []
+    mock_websocket.send_bytes.side_effect = sent_bytes.append
 
     # Run the message processing
     await websocket_handler._process_question(mock_websocket, id(mock_websocket))
+    sent_messages = [MemoryChunk.FromString(data) for data in sent_bytes]
 
     answer_messages = [
         msg for msg in sent_messages if msg.metadata.type == ChunkType.ANSWER
@@ -327,7 +367,7 @@ async def test_websocket_message_processing_question(
     assert len(answer_messages) > 0  # Should have answer responses
 
     # Verify RAG was called
-    container.rag.answer_question.assert_called_once()
+    rag_container.rag.answer_question.assert_called_once()
 
 
 # ----------------------------
@@ -336,9 +376,13 @@ async def test_websocket_message_processing_question(
 
 
 @pytest.mark.asyncio
-async def test_startup_event():
+async def test_startup_event(monkeypatch):
     """Test that the startup event initializes the handler correctly."""
-    with patch("api.main.Container.create") as mock_create:
+    # Restore the module-level handler after the test so no state leaks into
+    # other tests
+    monkeypatch.setattr(main, "handler", None)
+
+    with patch.object(main.Container, "create") as mock_create:
         mock_container = MagicMock()
         mock_create.return_value = mock_container
 
@@ -359,27 +403,10 @@ async def test_startup_event():
 @pytest.mark.asyncio
 async def test_transcribe_saves_memory(container, memory_servicer, collect_responses):
     """Test that memory transcription works through servicer (legacy compatibility)."""
-    session_id = "test_session"
-    memory_id = "test-memory-id"
-
-    audio_chunk = MemoryChunk(
-        audio_data=b"\x00" * (container.sample_rate * 4),
-        metadata=ChunkMetadata(
-            type=ChunkType.MEMORY, session_id=session_id, memory_id=memory_id
-        ),
-    )
-    final_chunk = MemoryChunk(
-        metadata=ChunkMetadata(
-            type=ChunkType.MEMORY,
-            session_id=session_id,
-            memory_id=memory_id,
-            is_final=True,
-        )
-    )
 
     async def request_iterator():
-        yield audio_chunk
-        yield final_chunk
+        yield MEMORY_AUDIO_CHUNK
+        yield MEMORY_FINAL_CHUNK
 
     responses = await collect_responses(
         request_iterator(), memory_servicer.StoreMemory, None
@@ -390,49 +417,12 @@ async def test_transcribe_saves_memory(container, memory_servicer, collect_respo
 
 
 @pytest.mark.asyncio
-async def test_transcribe_text_input(container, qa_servicer, collect_responses):
+async def test_transcribe_text_input(rag_container, qa_servicer, collect_responses):
     """Test text input processing through servicer (legacy compatibility)."""
-    # Answer payload from RAG
-    mock_memory_req = MagicMock()
-    mock_memory_req.text = ["test answer"]
-    mock_memory_req.id = "answer-id"
-
-    mock_memory_response = MagicMock()
-    mock_memory_response.response = mock_memory_req
-    mock_memory_response.metadata = {"is_final": True}
-    mock_memory_response.tokens_used = 10
-
-    # Vector store returns a MemoryContext
-    mock_memory_context = MagicMock(spec=MemoryContext)
-    mock_memory_context.memories = {}
-    container.vector_store.search.return_value = mock_memory_context
-
-    class AsyncGenMock:
-        async def __aiter__(self):
-            yield mock_memory_response
-
-    container.rag.answer_question = MagicMock(return_value=AsyncGenMock())
-
-    session_id = "test_text_session"
-    memory_id = "test-memory-id"
-    text_chunk = MemoryChunk(
-        text_data="Hello, this is a test question.",
-        metadata=ChunkMetadata(
-            type=ChunkType.QUESTION, session_id=session_id, memory_id=memory_id
-        ),
-    )
-    final_chunk = MemoryChunk(
-        metadata=ChunkMetadata(
-            type=ChunkType.QUESTION,
-            session_id=session_id,
-            memory_id=memory_id,
-            is_final=True,
-        )
-    )
 
     async def request_iterator():
-        yield text_chunk
-        yield final_chunk
+        yield QUESTION_TEXT_CHUNK
+        yield QUESTION_FINAL_CHUNK
 
     responses = await collect_responses(
         request_iterator(), qa_servicer.AnswerQuestion, None
@@ -444,5 +434,5 @@ async def test_transcribe_text_input(container, qa_servicer, collect_responses):
     assert any(r.text_data == "test answer" for r in answer_responses)
 
     # RAG called with the chunk size passthrough we care about
-    _, kwargs = container.rag.answer_question.call_args
+    _, kwargs = rag_container.rag.answer_question.call_args
     assert kwargs["chunk_size_tokens"] == 8
@@ -1,4 +1,7 @@
-import hashlib
+import asyncio
+import functools
+import re
+import zlib
 from datetime import datetime
 
 import pytest
@@ -17,6 +20,33 @@ from ...vector_store.repositories.vector_store_repository_interface import (
 from ...models.embedding.embedding_model_interface import EmbeddingModel
 from ...models.text_chunker_interface import TextChunker
 
+_SENTENCE_END_PATTERN = re.compile(r"[.!?]+")
+
+
+@functools.lru_cache(maxsize=1024)
+def _embed_cached(text: str) -> tuple[float, ...]:
+    """Creates a deterministic embedding based on the text content."""
+    if not text:
+        return (0.0,) * 5
+
+    # Create a simple embedding based on text statistics
+    chars = len(text)
+    words = len(text.split())
+    unique = len(set(text.lower()))
+
+    # Non-cryptographic but stable across runs, unlike hash()
+    hash_value = zlib.crc32(text.encode())
+
+    # Create a simple 5-dimensional vector
+    return (
+        float(chars % 10) / 10,  # Length mod 10, normalized
+        float(words % 10) / 10,  # Word count mod 10, normalized
+        float(unique % 10) / 10,  # Unique chars mod 10, normalized
+        float(sum(ord(c) for c in text[:10]) % 10)
+        / 10,  # Sum of first 10 char codes, normalized
+        float(hash_value % 1000) / 1000,  # Hash of text, normalized
+    )
+
 
 class MockEmbeddingModel(EmbeddingModel):
     """
@@ -28,28 +58,8 @@ class MockEmbeddingModel(EmbeddingModel):
         return 5  # Small vectors for testing
 
     async def embed_text(self, text: str) -> list[float]:
-        """Creates a deterministic embedding based on the text content."""
-        if not text:
-            return [0.0] * 5
-
-        # Create a simple embedding based on text statistics
-        chars = len(text)
-        words = len(text.split())
-        unique = len(set(text.lower()))
-
-        hash_value = int(hashlib.md5(text.encode()).hexdigest(), 16)
-
-        # Create a simple 5-dimensional vector
-        vec = [
-            float(chars % 10) / 10,  # Length mod 10, normalized
-            float(words % 10) / 10,  # Word count mod 10, normalized
-            float(unique % 10) / 10,  # Unique chars mod 10, normalized
-            float(sum(ord(c) for c in text[:10]) % 10)
-            / 10,  # Sum of first 10 char codes, normalized
-            float(hash_value % 1000) / 1000,  # Hash of text, normalized
-        ]
-
-        return vec
+        """Creates a deterministic embedding, cached per text."""
+        return list(_embed_cached(text))
 
 
 class SimpleTextChunker(TextChunker):
@@ -64,45 +74,44 @@ class SimpleTextChunker(TextChunker):
     def chunk_text(self, text: str) -> list[str]:
         """Split text into chunks by sentences, respecting max chunk size."""
         # Simple sentence splitting
-        sentences = [
-            s.strip()
-            for s in text.replace("!", ".").replace("?", ".").split(".")
-            if s.strip()
-        ]
+        sentences = [s.strip() for s in _SENTENCE_END_PATTERN.split(text) if s.strip()]
 
         chunks = []
-        current_chunk = ""
+        current_parts = []
+        # Length of ". ".join(current_parts), tracked without joining
+        current_length = 0
 
         for sentence in sentences:
-            if len(current_chunk) + len(sentence) > self.max_chunk_size:
-                if current_chunk:
-                    chunks.append(current_chunk)
-                current_chunk = sentence
+            if current_length + len(sentence) > self.max_chunk_size:
+                if current_parts:
+                    chunks.append(". ".join(current_parts))
+                current_parts = [sentence]
+                current_length = len(sentence)
             else:
-                if current_chunk:
-                    current_chunk += ". " + sentence
-                else:
-                    current_chunk = sentence
+                if current_parts:
+                    current_length += 2
+                current_parts.append(sentence)
+                current_length += len(sentence)
 
-        if current_chunk:
-            chunks.append(current_chunk)
+        if current_parts:
+            chunks.append(". ".join(current_parts))
 
         return chunks
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def embedding_model():
     return MockEmbeddingModel()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def text_chunker():
     return SimpleTextChunker(max_chunk_size=50)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def test_memories():
-    return [
+    return tuple(
         MemoryRequest.create(
             text=[
                 f"This is test memory {i}. "
@@ -112,10 +121,10 @@ def test_memories():
             timestamp=datetime.now(),
         )
         for i in range(5)
-    ]
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def long_text_memory():
     return MemoryRequest.create(
         text=[
@@ -131,22 +140,39 @@ def long_text_memory():
     )
 
 
-@pytest_asyncio.fixture
-async def repository(embedding_model, text_chunker, test_memories, long_text_memory):
+async def build_repository(
+    embedding_model, text_chunker, test_memories, long_text_memory
+) -> InMemoryQdrantVectorStoreRepository:
     repo = InMemoryQdrantVectorStoreRepository(
         embedding_model=embedding_model, text_chunker=text_chunker
     )
 
-    # Index all test memories
-    for memory in test_memories:
-        await repo.index_memory(memory)
-
-    # Index the long text memory
-    await repo.index_memory(long_text_memory)
+    # Index all test memories and the long text memory concurrently
+    await asyncio.gather(
+        *(repo.index_memory(memory) for memory in (*test_memories, long_text_memory))
+    )
 
     return repo
 
 
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def shared_repository(
+    embedding_model, text_chunker, test_memories, long_text_memory
+):
+    """Indexed repository shared by the tests that only read from it."""
+    return await build_repository(
+        embedding_model, text_chunker, test_memories, long_text_memory
+    )
+
+
+@pytest_asyncio.fixture
+async def repository(embedding_model, text_chunker, test_memories, long_text_memory):
+    """Freshly indexed repository for tests that add or delete memories."""
+    return await build_repository(
+        embedding_model, text_chunker, test_memories, long_text_memory
+    )
+
+
 @pytest.mark.asyncio
 async def test_index_and_get_memory(repository):
     """Test indexing a memory and retrieving it by ID."""
@@ -171,7 +197,7 @@ async def test_index_and_get_memory(repository):
 
 
 @pytest.mark.asyncio
-async def test_search_similar(repository):
+async def test_search_similar(shared_repository):
     """Test searching for similar memories."""
     # Create a query memory
     query = MemoryRequest.create(
@@ -180,7 +206,7 @@ async def test_search_similar(repository):
     )
 
     # Search for similar memories
-    results = await repository.search_similar(query, limit=3)
+    results = await shared_repository.search_similar(query, limit=3)
 
     # Verify results
     assert isinstance(results, MemoryContext)
@@ -190,11 +216,13 @@ async def test_search_similar(repository):
     # Should find memories
     memories = results.get_memory_objects()
     assert len(memories) >= 1
+    # Timestamps are parsed when the points are loaded
+    assert all(isinstance(memory.timestamp, datetime) for memory in memories)
 
 
 @pytest.mark.asyncio
 async def test_search_similar_with_chunks(
-    repository: VectorStoreRepository, long_text_memory
+    shared_repository: VectorStoreRepository, long_text_memory
 ):
     """Test searching that retrieves chunk results."""
     # Create a query specifically targeting text in the long memory
@@ -204,7 +232,7 @@ async def test_search_similar_with_chunks(
     )
 
     # Search with chunk results enabled (default)
-    results = await repository.search_similar(query, limit=9)
+    results = await shared_repository.search_similar(query, limit=9)
 
     # Verify we got results
     assert not results.is_empty()
@@ -235,7 +263,7 @@ async def test_search_similar_with_chunks(
 
 
 @pytest.mark.asyncio
-async def test_search_without_chunks(repository):
+async def test_search_without_chunks(shared_repository):
     """Test searching with chunks disabled."""
     # Create a query
     query = MemoryRequest.create(
@@ -244,7 +272,9 @@ async def test_search_without_chunks(repository):
     )
 
     # Search with chunk results disabled
-    results = await repository.search_similar(query, limit=3, search_chunks=False)
+    results = await shared_repository.search_similar(
+        query, limit=3, search_chunks=False
+    )
 
     # We should still get results, but matched text should be full texts only
     for memory_id, matched_text in results.matched_texts.items():
@@ -289,20 +319,20 @@ async def test_delete_memory(repository, test_memories):
 
 
 @pytest.mark.asyncio
-async def test_list_memories(repository, test_memories):
+async def test_list_memories(shared_repository, test_memories):
     """Test listing memories with filters and pagination."""
     # List all memories
-    memories, offset_token = await repository.list_memories()
+    memories, offset_token = await shared_repository.list_memories()
 
     # Should include both our standard test memories and the long text memory
     assert len(memories) >= len(test_memories)
 
     # Test with limit
-    limited, offset_uuid = await repository.list_memories(limit=2)
+    limited, offset_uuid = await shared_repository.list_memories(limit=2)
     assert len(limited) == 2
 
     # Test with offset
-    offset, _ = await repository.list_memories(offset=offset_uuid, limit=2)
+    offset, _ = await shared_repository.list_memories(offset=offset_uuid, limit=2)
     assert len(offset) == 2
     assert limited[0].id != offset[0].id, "Should be different memories"
 
@@ -313,7 +343,7 @@ async def test_list_memories(repository, test_memories):
         value=MemoryType.MEMORY.value,
     )
 
-    filtered, _ = await repository.list_memories(filters=memory_filter)
+    filtered, _ = await shared_repository.list_memories(filters=memory_filter)
 
     # All returned memories should be of type MEMORY
     for memory in filtered:
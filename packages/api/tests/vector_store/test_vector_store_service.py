@@ -7,9 +7,9 @@ from ...domain.memory_request import MemoryRequest
 from ...vector_store.vector_store_service import VectorStoreService
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_repository():
-    """Fixture for a mock repository."""
+    """Fixture for a mock repository shared across the module."""
     repository = AsyncMock()
 
     # Set up the methods we'll use
@@ -21,12 +21,19 @@ def mock_repository():
     return repository
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def vector_store_service(mock_repository):
     """Fixture for the vector store service with mocked repository."""
     return VectorStoreService(repository=mock_repository)
 
 
+@pytest.fixture(autouse=True)
+def reset_mock_repository(mock_repository):
+    """Reset calls, return values and side effects after each test."""
+    yield
+    mock_repository.reset_mock(return_value=True, side_effect=True)
+
+
 @pytest.fixture
 def sample_memory():
     """Fixture for a sample memory object."""
@@ -7,6 +7,9 @@ import numpy as np
 from protos.generated.py import stt_pb2_grpc, stt_pb2
 from .dependency_container import Container
 
+# Scale from int16 PCM samples to float32 audio in [-1.0, 1.0)
+INT16_TO_FLOAT32_SCALE = np.float32(1.0 / 32768.0)
+
 
 class TranscriptionServiceServicer(stt_pb2_grpc.TranscriptionServiceServicer):
     """
@@ -49,7 +52,6 @@ class TranscriptionServiceServicer(stt_pb2_grpc.TranscriptionServiceServicer):
         logging.info("Client connected.")
 
         # State tracking
-        audio_data = bytearray()
         transcription = []
         session_type = stt_pb2.ChunkType.MEMORY  # Default type
         session_id = None
@@ -57,6 +59,10 @@ class TranscriptionServiceServicer(stt_pb2_grpc.TranscriptionServiceServicer):
         first_chunk = True
         question_completed = False
         transcription_complete = False
+        # Metadata shared by every transcript chunk of this session, copied
+        # into each outgoing chunk
+        transcript_metadata = stt_pb2.ChunkMetadata(type=stt_pb2.ChunkType.TRANSCRIPT)
+        memory_chunk_cls = stt_pb2.MemoryChunk
 
         try:
             logging.info("Received a new transcription request.")
@@ -71,6 +77,11 @@ class TranscriptionServiceServicer(stt_pb2_grpc.TranscriptionServiceServicer):
                     session_type = chunk.metadata.type
                     session_id = chunk.metadata.session_id
                     memory_id = chunk.metadata.memory_id
+                    transcript_metadata = stt_pb2.ChunkMetadata(
+                        session_id=session_id,
+                        memory_id=memory_id,
+                        type=stt_pb2.ChunkType.TRANSCRIPT,
+                    )
                     logging.info(
                         f"Session {session_id} started with type: {session_type}, "
                         f"memory ID: {memory_id}"
@@ -86,15 +97,10 @@ class TranscriptionServiceServicer(stt_pb2_grpc.TranscriptionServiceServicer):
                         transcription_complete = True
 
                         # Send a final transcript marker back to client
-                        yield stt_pb2.MemoryChunk(
-                            text_data="",
-                            metadata=stt_pb2.ChunkMetadata(
-                                session_id=session_id,
-                                memory_id=memory_id,
-                                type=stt_pb2.ChunkType.TRANSCRIPT,
-                                is_final=True,
-                            ),
-                        )
+                        final_marker = memory_chunk_cls(text_data="")
+                        final_marker.metadata.CopyFrom(transcript_metadata)
+                        final_marker.metadata.is_final = True
+                        yield final_marker
 
                         # Process based on session type
                         if session_type == stt_pb2.ChunkType.MEMORY:
@@ -115,33 +121,27 @@ class TranscriptionServiceServicer(stt_pb2_grpc.TranscriptionServiceServicer):
 
                 # Handle audio input
                 if chunk.HasField("audio_data"):
-                    audio_data += chunk.audio_data
-
-                    # Convert audio bytes to float32 numpy array
-                    audio_array = (
-                        np.frombuffer(chunk.audio_data, dtype=np.int16).astype(
-                            np.float32
-                        )
-                        / 32768.0
+                    # Convert int16 PCM bytes to float32 in a single scaled pass
+                    audio_array = np.multiply(
+                        np.frombuffer(chunk.audio_data, dtype=np.int16),
+                        INT16_TO_FLOAT32_SCALE,
+                        dtype=np.float32,
                     )
 
                     # Pass to transcriber (handles its own buffering)
                     segments, _ = self.transcriber.transcribe(audio_array)
 
                     # Accumulate transcription text
-                    transcription.extend(segment.text for segment in segments)
-
-                    # Send transcript chunks to client
-                    for segment in segments:
-                        yield stt_pb2.MemoryChunk(
-                            text_data=segment.text,
-                            metadata=stt_pb2.ChunkMetadata(
-                                session_id=session_id,
-                                memory_id=memory_id,
-                                type=stt_pb2.ChunkType.TRANSCRIPT,
-                                is_final=False,
-                            ),
-                        )
+                    segment_texts = [segment.text for segment in segments]
+                    transcription.extend(segment_texts)
+
+                    # Send all segments of this call as one transcript chunk;
+                    # the joined text equals the per-segment texts in order
+                    joined_text = "".join(segment_texts)
+                    if joined_text:
+                        transcript_chunk = memory_chunk_cls(text_data=joined_text)
+                        transcript_chunk.metadata.CopyFrom(transcript_metadata)
+                        yield transcript_chunk
 
                 # Handle direct text input
                 elif chunk.HasField("text_data"):
@@ -149,15 +149,9 @@ class TranscriptionServiceServicer(stt_pb2_grpc.TranscriptionServiceServicer):
                     transcription.append(chunk.text_data)
 
                     # Echo text back as transcript
-                    yield stt_pb2.MemoryChunk(
-                        text_data=chunk.text_data,
-                        metadata=stt_pb2.ChunkMetadata(
-                            session_id=session_id,
-                            memory_id=memory_id,
-                            type=stt_pb2.ChunkType.TRANSCRIPT,
-                            is_final=False,
-                        ),
-                    )
+                    transcript_chunk = memory_chunk_cls(text_data=chunk.text_data)
+                    transcript_chunk.metadata.CopyFrom(transcript_metadata)
+                    yield transcript_chunk
 
         except grpc.aio.AioRpcError as e:
             logging.error(f"Error during transcription: {e}")
@@ -1,4 +1,5 @@
 import logging
+from datetime import datetime
 from uuid import UUID, uuid4
 
 
@@ -26,6 +27,22 @@ from .vector_store_repository_interface import (
     VectorStoreRepository,
 )
 
+# Scalar int8 quantization for server collections. Qdrant keeps the quantized
+# vectors in RAM for the first search pass and rescores the candidates with
+# the original float vectors.
+INT8_QUANTIZATION = models.ScalarQuantization(
+    scalar=models.ScalarQuantizationConfig(
+        type=models.ScalarType.INT8,
+        quantile=0.99,
+        always_ram=True,
+    )
+)
+
+
+def _parse_timestamp(value: str | None) -> datetime | None:
+    """Parse an ISO timestamp from a point payload once, when it is loaded."""
+    return datetime.fromisoformat(value) if value else None
+
 
 class QdrantVectorStoreRepository(VectorStoreRepository):
     """
@@ -39,6 +56,7 @@ class QdrantVectorStoreRepository(VectorStoreRepository):
         embedding_model: EmbeddingModel,
         text_chunker: TextChunker,
         collection_name="memories",
+        quantization_config: models.QuantizationConfig | None = None,
     ):
         """
         Initialize the Qdrant in-memory vector store repository.
@@ -47,6 +65,8 @@ class QdrantVectorStoreRepository(VectorStoreRepository):
             collection_name: Name of the collection to store vectors
             vector_size: Dimension of vectors
                 (should match your embedding model's output)
+            quantization_config: Optional vector quantization for a newly
+                created collection. Ignored by Qdrant's local mode.
         """
         super().__init__(embedding_model=embedding_model, text_chunker=text_chunker)
 
@@ -61,6 +81,7 @@ class QdrantVectorStoreRepository(VectorStoreRepository):
                 vectors_config=models.VectorParams(
                     size=self.vector_size, distance=models.Distance.COSINE
                 ),
+                quantization_config=quantization_config,
             )
 
         # Store memory objects for quick access (not in vector store)
@@ -84,7 +105,7 @@ class QdrantVectorStoreRepository(VectorStoreRepository):
         self._memories[memory_id] = memory
 
         # Join the list of text segments into a single string
-        full_text = " ".join(memory.text)
+        full_text = memory.full_text
 
         # Generate chunks using the text chunker
         chunks = self.text_chunker.chunk_text(full_text)
@@ -162,7 +183,7 @@ class QdrantVectorStoreRepository(VectorStoreRepository):
         text_metadata = []  # Track what each text is for
 
         for memory in memories:
-            full_text = " ".join(memory.text)
+            full_text = memory.full_text
             chunks = self.text_chunker.chunk_text(full_text)
 
             # Add full text
@@ -309,7 +330,7 @@ class QdrantVectorStoreRepository(VectorStoreRepository):
             id=UUID(memory_id),
             text=point.payload.get("text", []),
             memory_type=MemoryType(point.payload.get("memory_type", 0)),
-            timestamp=point.payload.get("timestamp"),
+            timestamp=_parse_timestamp(point.payload.get("timestamp")),
         )
 
         # Update cache
@@ -337,7 +358,7 @@ class QdrantVectorStoreRepository(VectorStoreRepository):
         Returns:
             MemoryContext containing the search results
         """
-        query_text = " ".join(query.text)
+        query_text = query.full_text
         query_vector = await self.embedding_model.embed_text(query_text)
 
         query_filter = self._create_search_filter(filters, search_chunks)
@@ -414,7 +435,7 @@ class QdrantVectorStoreRepository(VectorStoreRepository):
                     id=UUID(memory_id),
                     text=parent.payload.get("text", []),
                     memory_type=MemoryType(parent.payload.get("memory_type", 0)),
-                    timestamp=parent.payload.get("timestamp"),
+                    timestamp=_parse_timestamp(parent.payload.get("timestamp")),
                 )
                 self._memories[memory_id] = memory
                 return memory, matched_text
@@ -436,7 +457,7 @@ class QdrantVectorStoreRepository(VectorStoreRepository):
                 id=UUID(memory_id),
                 text=result.payload.get("text", []),
                 memory_type=MemoryType(result.payload.get("memory_type", 0)),
-                timestamp=result.payload.get("timestamp"),
+                timestamp=_parse_timestamp(result.payload.get("timestamp")),
             )
             self._memories[memory_id] = memory
             return memory, matched_text
@@ -537,7 +558,7 @@ class QdrantVectorStoreRepository(VectorStoreRepository):
                     id=memory_id,
                     text=point.payload.get("text", []),
                     memory_type=MemoryType(point.payload.get("memory_type", 0)),
-                    timestamp=point.payload.get("timestamp"),
+                    timestamp=_parse_timestamp(point.payload.get("timestamp")),
                 )
                 # Update cache
                 self._memories[memory_id] = memory
@@ -717,6 +738,7 @@ class ServerQdrantVectorStoreRepository(QdrantVectorStoreRepository):
         text_chunker: TextChunker,
         url: str = "http://localhost:6333",
         collection_name="memories",
+        quantization_config: models.QuantizationConfig | None = INT8_QUANTIZATION,
     ):
         """
         Initialize the Qdrant in-memory vector store repository.
@@ -725,6 +747,8 @@ class ServerQdrantVectorStoreRepository(QdrantVectorStoreRepository):
             collection_name: Name of the collection to store vectors
             vector_size: Dimension of vectors
                 (should match your embedding model's output)
+            quantization_config: Vector quantization for a newly created
+                collection (default: int8 scalar quantization)
         """
 
         # Initialize in-memory Qdrant client
@@ -735,4 +759,5 @@ class ServerQdrantVectorStoreRepository(QdrantVectorStoreRepository):
             embedding_model=embedding_model,
             text_chunker=text_chunker,
             collection_name=collection_name,
+            quantization_config=quantization_config,
         )
@@ -88,13 +88,15 @@ class DataFrameDataset:
         if self.queries.empty or self.qrels.empty:
             return None
 
-        for _, query_row in self.queries.iterrows():
-            query_id = str(query_row["id"])
-            query_text = str(query_row["text"])
+        qrels_query_ids = self.qrels["query_id"].astype(str)
+        judged_query_ids = set(qrels_query_ids)
 
-            relevant_qrels = self.qrels[self.qrels["query_id"].astype(str) == query_id]
+        for query_row in self.queries.itertuples(index=False):
+            query_id = str(query_row.id)
+            query_text = str(query_row.text)
 
-            if not relevant_qrels.empty:
+            if query_id in judged_query_ids:
+                relevant_qrels = self.qrels[qrels_query_ids == query_id]
                 relevant_docs = relevant_qrels["doc_id"].astype(str).tolist()
                 relevance_scores = dict(
                     zip(
@@ -37,11 +37,9 @@ class OpenLifelogQADataset(DataFrameDataset):
 
         # Build qrels: each query links to all ImageIDs in its row
         qrels_rows = []
-        for _, row in queries_df.iterrows():
-            query_id = str(row["id"])
-            image_ids = ast.literal_eval(
-                row.get("ImageID", "[]")
-            )  # ImageID is a stringified list
+        for row in queries_df.itertuples(index=False):
+            query_id = str(row.id)
+            image_ids = ast.literal_eval(row.ImageID)  # ImageID is a stringified list
             for img_id in image_ids:
                 qrels_rows.append({
                     "query_id": query_id,
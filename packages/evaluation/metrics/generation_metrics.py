@@ -1,3 +1,4 @@
+import functools
 import re
 import string
 from collections import Counter
@@ -30,7 +31,9 @@ class GenerationMetrics:
         )
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def _normalize(text: str) -> str:
+        # Cached: every metric re-normalizes the same answer and gold strings
         if text is None:
             return ""
         text = re.sub(
@@ -45,8 +48,11 @@ class GenerationMetrics:
         return " ".join(tokens)
 
     @staticmethod
-    def _tokens(text: str) -> list[str]:
-        return GenerationMetrics._normalize(text).split()
+    @functools.lru_cache(maxsize=4096)
+    def _tokens(text: str) -> tuple[str, ...]:
+        # Shared by every metric for the same answer/gold strings; a tuple so
+        # cached results cannot be mutated by callers
+        return tuple(GenerationMetrics._normalize(text).split())
 
     # Correctness vs gold answers
     @staticmethod
@@ -83,20 +89,24 @@ class GenerationMetrics:
         if GenerationMetrics.empty_gold_answer_guard(gold_answers):
             return 0.0
 
-        def f1_pair(p: str, g: str) -> float:
-            pt, gt = GenerationMetrics._tokens(p), GenerationMetrics._tokens(g)
+        # Tokenize and count the prediction once, not once per gold answer
+        pt = GenerationMetrics._tokens(pred)
+        pred_counts = Counter(pt)
+
+        def f1_gold(g: str) -> float:
+            gt = GenerationMetrics._tokens(g)
             if not pt and not gt:
                 return 1.0
             if not pt or not gt:
                 return 0.0
-            common = sum((Counter(pt) & Counter(gt)).values())
+            common = sum((pred_counts & Counter(gt)).values())
             if common == 0:
                 return 0.0
             precision = common / len(pt)
             recall = common / len(gt)
             return 2 * precision * recall / (precision + recall)
 
-        return max(f1_pair(pred, g) for g in gold_answers)
+        return max(f1_gold(g) for g in gold_answers)
 
     @staticmethod
     def rouge_l_f1(pred: str, gold_answers: list[str]) -> float:
@@ -114,7 +124,7 @@ class GenerationMetrics:
             return 0.0
 
         # LCS-based ROUGE-L F1 (single-ref max)
-        def lcs(a: list[str], b: list[str]) -> int:
+        def lcs(a: tuple[str, ...], b: tuple[str, ...]) -> int:
             m, n = len(a), len(b)
             dp = [[0] * (n + 1) for _ in range(m + 1)]
             for i in range(1, m + 1):
@@ -162,7 +172,7 @@ class GenerationMetrics:
 
     # Faithfulness to retrieved docs
     @staticmethod
-    def _content_words(tokens: list[str]) -> list[str]:
+    def _content_words(tokens: tuple[str, ...]) -> list[str]:
         # keep non-stopword-ish tokens (very light filter)
         stopish = GenerationMetrics._ARTICLES | {
             "of",
@@ -4,6 +4,7 @@ Evaluation Metrics Calculator
 Standard information retrieval evaluation metrics implementation.
 """
 
+import heapq
 import math
 
 
@@ -103,6 +104,58 @@ class RetrievalMetrics:
 
         return 0.0  # No relevant document found
 
+    @staticmethod
+    def rank_metrics_at_k(
+        retrieved_docs: list[str],
+        relevant_docs: list[str],
+        ks: tuple[int, ...],
+    ) -> dict[str, float]:
+        """
+        Calculate precision@k, recall@k and MRR@k for several cutoffs at once.
+
+        Equivalent to calling precision_at_k, recall_at_k and
+        mean_reciprocal_rank for every k, but walks the ranking only once.
+
+        Args:
+            retrieved_docs (list[str]): List of retrieved document IDs
+                in rank order
+            relevant_docs (list[str]): List of relevant document IDs
+            ks (tuple[int, ...]): Positive rank cutoffs to evaluate
+
+        Returns:
+            dict[str, float]: Scores keyed "precision@k", "recall@k" and
+                "mrr@k" for each k, plus the uncut "mrr"
+        """
+        relevant_set = set(relevant_docs)
+        hits_at_k: dict[int, int] = {}
+        first_rank = 0
+        hits = 0
+        max_k = max(ks)
+        for rank, doc_id in enumerate(retrieved_docs, 1):
+            if doc_id in relevant_set:
+                hits += 1
+                if not first_rank:
+                    first_rank = rank
+            if rank in ks:
+                hits_at_k[rank] = hits
+            # Past the last cutoff only the first relevant rank still matters
+            if rank >= max_k and first_rank:
+                break
+
+        metrics: dict[str, float] = {}
+        for k in ks:
+            if not retrieved_docs:
+                metrics[f"precision@{k}"] = 0.0
+                metrics[f"recall@{k}"] = 0.0
+                metrics[f"mrr@{k}"] = 0.0
+                continue
+            hits_k = hits_at_k.get(k, hits)
+            metrics[f"precision@{k}"] = hits_k / min(k, len(retrieved_docs))
+            metrics[f"recall@{k}"] = hits_k / len(relevant_set) if relevant_set else 0.0
+            metrics[f"mrr@{k}"] = 1.0 / first_rank if 0 < first_rank <= k else 0.0
+        metrics["mrr"] = 1.0 / first_rank if first_rank else 0.0
+        return metrics
+
     @staticmethod
     def ndcg_at_k(
         retrieved_docs: list[str],
@@ -138,8 +191,8 @@ class RetrievalMetrics:
             dcg += rel / math.log2(i + 2)
 
         # Calculate ideal DCG (IDCG)
-        # Sort relevance scores in descending order and take top k
-        ideal_relevances = sorted(relevance_scores.values(), reverse=True)[:k]
+        # Take the top k relevance scores in descending order
+        ideal_relevances = heapq.nlargest(k, relevance_scores.values())
         idcg = 0.0
         for i, rel in enumerate(ideal_relevances):
             idcg += rel / math.log2(i + 2)
@@ -191,16 +244,54 @@ class RetrievalMetrics:
         retrieved_set = set(retrieved_docs)
         relevant_set = set(relevant_docs)
 
+        return RetrievalMetrics.aqwv_from_counts(
+            num_retrieved=len(retrieved_set),
+            num_relevant=len(relevant_set),
+            true_positives=len(retrieved_set.intersection(relevant_set)),
+            beta=beta,
+            collection_size=collection_size,
+        )
+
+    @staticmethod
+    def aqwv_from_counts(
+        num_retrieved: int,
+        num_relevant: int,
+        true_positives: int,
+        beta: float = 40.0,
+        collection_size: int = -1,
+    ) -> float:
+        """
+        Calculate AQWV from precomputed set sizes.
+
+        Lets callers that already intersected the retrieved and relevant
+        sets reuse those counts instead of rebuilding both sets.
+
+        Args:
+            num_retrieved (int): Number of unique retrieved document IDs
+            num_relevant (int): Number of unique relevant document IDs,
+                must be positive
+            true_positives (int): Size of the retrieved/relevant intersection
+            beta (float): Weight factor for false alarms
+            collection_size (int): Total size of document collection
+
+        Returns:
+            float: AQWV score
+
+        Raises:
+            ValueError: If collection_size is not positive
+        """
+        if collection_size <= 0:
+            raise ValueError(f"collection_size must be positive, got {collection_size}")
+
         # Calculate misses and false alarms
-        true_positives = len(retrieved_set.intersection(relevant_set))
-        num_misses = len(relevant_set) - true_positives
-        num_false_alarms = len(retrieved_set) - true_positives
+        num_misses = num_relevant - true_positives
+        num_false_alarms = num_retrieved - true_positives
 
         # Calculate rates
-        p_miss = num_misses / len(relevant_set)
+        p_miss = num_misses / num_relevant
         p_fa = (
-            num_false_alarms / (collection_size - len(relevant_set))
-            if (collection_size - len(relevant_set)) > 0
+            num_false_alarms / (collection_size - num_relevant)
+            if (collection_size - num_relevant) > 0
             else 0.0
         )
 
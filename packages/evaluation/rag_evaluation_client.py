@@ -201,55 +201,9 @@ class RAGEvaluationClient:
             else 0
         )
 
-        # Calculate rank-aware metrics using the metrics library
-        precision_at_1 = RetrievalMetrics.precision_at_k(
-            retrieved_doc_ids, relevant_doc_ids, 1
-        )
-        precision_at_3 = RetrievalMetrics.precision_at_k(
-            retrieved_doc_ids, relevant_doc_ids, 3
-        )
-        precision_at_5 = RetrievalMetrics.precision_at_k(
-            retrieved_doc_ids, relevant_doc_ids, 5
-        )
-        precision_at_10 = RetrievalMetrics.precision_at_k(
-            retrieved_doc_ids, relevant_doc_ids, 10
-        )
-        precision_at_20 = RetrievalMetrics.precision_at_k(
-            retrieved_doc_ids, relevant_doc_ids, 20
-        )
-
-        recall_at_1 = RetrievalMetrics.recall_at_k(
-            retrieved_doc_ids, relevant_doc_ids, 1
-        )
-        recall_at_3 = RetrievalMetrics.recall_at_k(
-            retrieved_doc_ids, relevant_doc_ids, 3
-        )
-        recall_at_5 = RetrievalMetrics.recall_at_k(
-            retrieved_doc_ids, relevant_doc_ids, 5
-        )
-        recall_at_10 = RetrievalMetrics.recall_at_k(
-            retrieved_doc_ids, relevant_doc_ids, 10
-        )
-        recall_at_20 = RetrievalMetrics.recall_at_k(
-            retrieved_doc_ids, relevant_doc_ids, 20
-        )
-
-        mrr = RetrievalMetrics.mean_reciprocal_rank(retrieved_doc_ids, relevant_doc_ids)
-
-        mrr_at_1 = RetrievalMetrics.mean_reciprocal_rank(
-            retrieved_doc_ids[:1], relevant_doc_ids
-        )
-        mrr_at_3 = RetrievalMetrics.mean_reciprocal_rank(
-            retrieved_doc_ids[:3], relevant_doc_ids
-        )
-        mrr_at_5 = RetrievalMetrics.mean_reciprocal_rank(
-            retrieved_doc_ids[:5], relevant_doc_ids
-        )
-        mrr_at_10 = RetrievalMetrics.mean_reciprocal_rank(
-            retrieved_doc_ids[:10], relevant_doc_ids
-        )
-        mrr_at_20 = RetrievalMetrics.mean_reciprocal_rank(
-            retrieved_doc_ids[:20], relevant_doc_ids
+        # Calculate rank-aware metrics in a single pass over the ranking
+        rank_metrics = RetrievalMetrics.rank_metrics_at_k(
+            retrieved_doc_ids, relevant_doc_ids, (1, 3, 5, 10, 20)
         )
 
         # For NDCG, we need relevance scores
@@ -259,10 +213,11 @@ class RAGEvaluationClient:
         ndcg_at_10 = RetrievalMetrics.ndcg_at_k(retrieved_doc_ids, relevance_scores, 10)
         ndcg_at_20 = RetrievalMetrics.ndcg_at_k(retrieved_doc_ids, relevance_scores, 20)
 
-        # Calculate AQWV
-        aqwv = RetrievalMetrics.aqwv(
-            retrieved_doc_ids,
-            relevant_doc_ids,
+        # Calculate AQWV, reusing the set sizes and intersection from above
+        aqwv = RetrievalMetrics.aqwv_from_counts(
+            num_retrieved=len(retrieved_set),
+            num_relevant=len(relevant_set),
+            true_positives=true_positives,
             beta=40.0,
             collection_size=collection_size,
         )
@@ -271,22 +226,22 @@ class RAGEvaluationClient:
             "precision": precision,
             "recall": recall,
             "f1": f1,
-            "precision@1": precision_at_1,
-            "precision@3": precision_at_3,
-            "precision@5": precision_at_5,
-            "precision@10": precision_at_10,
-            "precision@20": precision_at_20,
-            "recall@1": recall_at_1,
-            "recall@3": recall_at_3,
-            "recall@5": recall_at_5,
-            "recall@10": recall_at_10,
-            "recall@20": recall_at_20,
-            "mrr": mrr,
-            "mrr@1": mrr_at_1,
-            "mrr@3": mrr_at_3,
-            "mrr@5": mrr_at_5,
-            "mrr@10": mrr_at_10,
-            "mrr@20": mrr_at_20,
+            "precision@1": rank_metrics["precision@1"],
+            "precision@3": rank_metrics["precision@3"],
+            "precision@5": rank_metrics["precision@5"],
+            "precision@10": rank_metrics["precision@10"],
+            "precision@20": rank_metrics["precision@20"],
+            "recall@1": rank_metrics["recall@1"],
+            "recall@3": rank_metrics["recall@3"],
+            "recall@5": rank_metrics["recall@5"],
+            "recall@10": rank_metrics["recall@10"],
+            "recall@20": rank_metrics["recall@20"],
+            "mrr": rank_metrics["mrr"],
+            "mrr@1": rank_metrics["mrr@1"],
+            "mrr@3": rank_metrics["mrr@3"],
+            "mrr@5": rank_metrics["mrr@5"],
+            "mrr@10": rank_metrics["mrr@10"],
+            "mrr@20": rank_metrics["mrr@20"],
             "ndcg@1": ndcg_at_1,
             "ndcg@3": ndcg_at_3,
             "ndcg@5": ndcg_at_5,
@@ -448,27 +403,33 @@ class RAGEvaluationClient:
 
         missing_gold_answer_count = 0
 
-        for i, (_, query) in enumerate(
-            tqdm(queries_df.iterrows(), total=total_queries)
+        # Group ground truth by query once instead of scanning qrels per query
+        relevant_docs_by_query: dict[str, list[str]] = {}
+        relevance_by_query: dict[str, dict[str, float]] = {}
+        for qrel_query_id, doc_id, relevance in zip(
+            qrels_df["query_id"].astype(str),
+            qrels_df["doc_id"].astype(str),
+            qrels_df["relevance"].astype(float),
+            strict=True,
+        ):
+            relevant_docs_by_query.setdefault(qrel_query_id, []).append(doc_id)
+            relevance_by_query.setdefault(qrel_query_id, {})[doc_id] = relevance
+
+        has_answers = "answers" in queries_df.columns
+        has_answer = "answer" in queries_df.columns
+
+        for i, query in enumerate(
+            tqdm(queries_df.itertuples(index=False), total=total_queries)
         ):
             if max_queries is not None and i >= max_queries:
                 break
 
-            query_id = str(query["id"])
-            query_text = str(query["text"])
+            query_id = str(query.id)
+            query_text = str(query.text)
 
             # Get relevant documents and relevance scores for this query
-            relevant_qrels = qrels_df[qrels_df["query_id"].astype(str) == query_id]
-            relevant_doc_ids = relevant_qrels["doc_id"].astype(str).tolist()
-
-            # Create relevance scores dictionary
-            relevance_scores = dict(
-                zip(
-                    relevant_qrels["doc_id"].astype(str),
-                    relevant_qrels["relevance"].astype(float),
-                    strict=False,
-                )
-            )
+            relevant_doc_ids = relevant_docs_by_query.get(query_id, [])
+            relevance_scores = relevance_by_query.get(query_id, {})
 
             # Process query
             (
@@ -498,14 +459,14 @@ class RAGEvaluationClient:
             # Evaluate generation (using gold answers if available)
             # NOTE: pull actual answer text from queries, NOT doc IDs
             gold_answers: list[str] = []
-            if "answers" in queries_df.columns and pd.notna(query.get("answers")):
-                val = query["answers"]
+            if has_answers and pd.notna(query.answers):
+                val = query.answers
                 if isinstance(val, list | tuple):
                     gold_answers = [str(x) for x in val]
                 else:
                     gold_answers = [str(val)]
-            elif "answer" in queries_df.columns and pd.notna(query.get("answer")):
-                gold_answers = [str(query["answer"])]
+            elif has_answer and pd.notna(query.answer):
+                gold_answers = [str(query.answer)]
 
             if GenerationMetrics.empty_gold_answer_guard(gold_answers):
                 missing_gold_answer_count += 1
@@ -0,0 +1,40 @@
+import pytest
+from metrics.retrieval_metrics import RetrievalMetrics
+
+
+@pytest.mark.parametrize(
+    "retrieved_docs,relevant_docs",
+    [
+        # Relevant docs spread across the cutoffs
+        (["d1", "d2", "d3", "d4", "d5", "d6"], ["d2", "d5", "d9"]),
+        # First relevant doc only after the last cutoff
+        ([f"x{i}" for i in range(25)] + ["d1"], ["d1"]),
+        # Fewer retrieved docs than the larger cutoffs
+        (["d1", "d2"], ["d1"]),
+        # Nothing retrieved
+        ([], ["d1"]),
+        # No ground truth
+        (["d1", "d2"], []),
+    ],
+)
+def test_rank_metrics_at_k_matches_individual_metrics(retrieved_docs, relevant_docs):
+    """
+    rank_metrics_at_k() is a single-pass shortcut and must agree with the
+    per-metric helpers for every cutoff.
+    """
+    ks = (1, 3, 5, 10, 20)
+    metrics = RetrievalMetrics.rank_metrics_at_k(retrieved_docs, relevant_docs, ks)
+
+    for k in ks:
+        assert metrics[f"precision@{k}"] == RetrievalMetrics.precision_at_k(
+            retrieved_docs, relevant_docs, k
+        )
+        assert metrics[f"recall@{k}"] == RetrievalMetrics.recall_at_k(
+            retrieved_docs, relevant_docs, k
+        )
+        assert metrics[f"mrr@{k}"] == RetrievalMetrics.mean_reciprocal_rank(
+            retrieved_docs[:k], relevant_docs
+        )
+    assert metrics["mrr"] == RetrievalMetrics.mean_reciprocal_rank(
+        retrieved_docs, relevant_docs
+    )